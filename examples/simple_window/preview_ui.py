@@ -3,20 +3,28 @@ from PySide6 import QtWidgets, QtCore
 from PySide6.QtUiTools import QUiLoader
 import qdarkstyle
 
-def preview_ui(ui_file_path):
-    app = QtWidgets.QApplication(sys.argv)
-    
-    # 应用 qdarkstyle
-    app.setStyleSheet(qdarkstyle.load_stylesheet(qt_api="pyside6"))
-    
-    # 加载UI文件
+
+def load_ui(ui_file_path):
     loader = QUiLoader()
     file = QtCore.QFile(ui_file_path)
     file.open(QtCore.QFile.ReadOnly)
-    window = loader.load(file)
-    file.close()
-    
+    try:
+        return loader.load(file)
+    finally:
+        file.close()
+
+
+def preview_ui(ui_file_path):
+    app = QtWidgets.QApplication(sys.argv)
+
+    # 加载UI文件
+    window = load_ui(ui_file_path)
     window.show()
+
+    # 窗口显示后再应用 qdarkstyle，避免创建控件时逐个匹配样式表
+    stylesheet = qdarkstyle.load_stylesheet(qt_api="pyside6")
+    QtCore.QTimer.singleShot(0, lambda: app.setStyleSheet(stylesheet))
+
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -24,4 +32,4 @@ if __name__ == "__main__":
         ui_file = sys.argv[1]
     else:
         ui_file = "trader.ui"  # 默认文件名
-    preview_ui(ui_file)
\ No newline at end of file
+    preview_ui(ui_file)
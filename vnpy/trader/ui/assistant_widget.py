@@ -2,6 +2,10 @@
 Trading Assistant Widget Implementation
 """
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from threading import Lock
 from typing import Optional
 from .qt import QtCore, QtGui, QtWidgets
 
@@ -12,13 +16,43 @@ from ..constant import Direction, Exchange, OrderType, Offset
 from ..locale import _
 
 
+@lru_cache(maxsize=1024)
+def _fmt_price(price: float) -> str:
+    """Format tick price into fixed-width display text, cached for repeated quotes."""
+    return format(price, ".3f")
+
+
+# Default symbol, name, price and quantity of each stock row
+ROW_DEFAULTS: tuple[tuple[str, str, str, str], ...] = (
+    ("600000", "浦发银行", "120.8", "5000"),
+    ("000002", "万科A", "20.88", "28920"),
+)
+
+# Time interval options of each side
+TIME_INTERVALS: tuple[int, ...] = (1, 2, 3, 5)
+
+# Side names, index 0 is buy and 1 is sell
+SIDES: tuple[str, ...] = ("buy", "sell")
+
+
+@dataclass(slots=True)
+class StockRow:
+    """Stock information of a row in buy or sell section."""
+
+    symbol: str = ""
+    name: str = ""
+
+
 class TradingAssistantWidget(QtWidgets.QWidget):
     """
     Trading Assistant Widget based on assistant.ui layout.
     Provides quick trading functionality for multiple stocks.
     """
-    
-    signal_tick: QtCore.Signal = QtCore.Signal(Event)
+
+    _fonts_ready: bool = False
+    _FONT_HEADER_16B: QtGui.QFont
+    _FONT_BTN_9B: QtGui.QFont
+    _FONT_BOLD: QtGui.QFont
 
     def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
         """Initialize the trading assistant widget."""
@@ -28,291 +62,308 @@ class TradingAssistantWidget(QtWidgets.QWidget):
         self.event_engine: EventEngine = event_engine
         
         # Store stock information
-        self.stock_info = {
-            "buy_1": {"symbol": "", "name": "浦发银行"},
-            "buy_2": {"symbol": "", "name": "万科A"},
-            "sell_1": {"symbol": "", "name": "浦发银行"},
-            "sell_2": {"symbol": "", "name": "万科A"}
-        }
-        
+        # Indexed by [side][row], side 0 is buy and 1 is sell
+        self.stocks: list[list[StockRow]] = [
+            [StockRow(symbol, name) for symbol, name, _price, _qty in ROW_DEFAULTS]
+            for _side in SIDES
+        ]
+
+        # Symbol -> (price edit, bound setText) pairs to be updated by tick data
+        self._symbol_to_targets: dict[str, list[tuple[QtWidgets.QLineEdit, Callable[[str], None]]]] = {}
+
+        # Latest tick price of each symbol waiting to be flushed into UI
+        self._pending_prices: dict[str, float] = {}
+        self._pending_lock: Lock = Lock()
+
+        # Last price written into each price edit
+        self._last_price: dict[QtWidgets.QLineEdit, float] = {}
+
         self.init_ui()
+        self.init_symbol_index()
+        self.init_timer()
         self.register_event()
 
+    @classmethod
+    def init_fonts(cls) -> None:
+        """Create fonts shared by all widget instances only once."""
+        if cls._fonts_ready:
+            return
+
+        cls._FONT_HEADER_16B = QtGui.QFont()
+        cls._FONT_HEADER_16B.setPointSize(16)
+        cls._FONT_HEADER_16B.setBold(True)
+
+        cls._FONT_BTN_9B = QtGui.QFont()
+        cls._FONT_BTN_9B.setPointSize(9)
+        cls._FONT_BTN_9B.setBold(True)
+
+        cls._FONT_BOLD = QtGui.QFont()
+        cls._FONT_BOLD.setBold(True)
+
+        cls._fonts_ready = True
+
     def init_ui(self) -> None:
-        """Initialize user interface."""
-        self.setFixedSize(1210, 175)  # 高度从200调整为175，实际上缩小了一些因为原来有多余空间
+        """
+        Initialize user interface.
+
+        The widget is not shown here, caller should call show() after construction.
+        """
+        self.init_fonts()
+
         self.setWindowTitle("交易助手")
         self.setWindowOpacity(1.0)
-        
-        # Create main layout
-        self.init_buy_section()
-        self.init_sell_section()
-        
-        # Show the widget
-        self.show()
-
-    def init_buy_section(self) -> None:
-        """Initialize buy (进货) section."""
-        # Buy header frame - 放大宽度
-        self.frame_buy_header = QtWidgets.QFrame(self)
-        self.frame_buy_header.setGeometry(0, 10, 600, 35)  # 高度从30调整为35
-        self.frame_buy_header.setFrameShape(QtWidgets.QFrame.Shape.Panel)
-        
-        # Buy label
-        self.label_buy = QtWidgets.QLabel("进货", self.frame_buy_header)
-        self.label_buy.setGeometry(10, 2, 75, 30)  # Y位置从0调整为2，增加顶部间距
-        font = QtGui.QFont()
-        font.setPointSize(16)  # 字体大小从20调整为16
-        font.setBold(True)
-        self.label_buy.setFont(font)
-        self.label_buy.setStyleSheet("color: rgb(255, 0, 0);")
-        
-        # Buy add button
-        self.pushButton_buy_add = QtWidgets.QPushButton("增加", self.frame_buy_header)
-        self.pushButton_buy_add.setGeometry(520, 2, 70, 30)  # Y位置从0调整为2，与标签对齐
-        font = QtGui.QFont()
-        font.setPointSize(9)  # 字体稍小
-        font.setBold(True)
-        self.pushButton_buy_add.setFont(font)
-        self.pushButton_buy_add.clicked.connect(self.on_buy_add_clicked)
-        
-        # Buy main frame - 增加高度避免边框被覆盖
-        self.frame_buy_main = QtWidgets.QFrame(self)
-        self.frame_buy_main.setGeometry(0, 50, 600, 120)  # Y位置从45调整为50，适应更高的header
-        self.frame_buy_main.setFrameShape(QtWidgets.QFrame.Shape.Panel)
-        
-        # Buy content frame
-        self.frame_buy_content = QtWidgets.QFrame(self.frame_buy_main)
-        self.frame_buy_content.setGeometry(10, 10, 580, 100)  # 宽度从575调整为580
-        self.frame_buy_content.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        
-        # Buy input controls
-        self.init_buy_controls()
-
-    def init_buy_controls(self) -> None:
-        """Initialize buy section controls."""
-        # Headers - 调整标题控件宽度以显示完整文字，并居中对齐到编辑框
-        QtWidgets.QLabel("代码", self.frame_buy_content).setGeometry(25, 5, 45, 18)  # 保持原位置
-        QtWidgets.QLabel("价格", self.frame_buy_content).setGeometry(175, 5, 45, 18)  # X位置调整为175，居中对齐价格编辑框
-        QtWidgets.QLabel("股数", self.frame_buy_content).setGeometry(255, 5, 45, 18)  # X位置调整为255，居中对齐股数编辑框
-        
-        # Row 1 controls - 适中输入框
-        self.lineEdit_buy_symbol_1 = QtWidgets.QLineEdit(self.frame_buy_content)
-        self.lineEdit_buy_symbol_1.setGeometry(10, 27, 75, 22)  # Y位置从22调整为27
-        self.lineEdit_buy_symbol_1.setText("600000")  # 设置默认股票代码
-        
-        self.label_buy_name_1 = QtWidgets.QLabel("浦发银行", self.frame_buy_content)
-        self.label_buy_name_1.setGeometry(85, 27, 70, 22)  # X位置从95调整为85，宽度从60调整为70
-        
-        self.lineEdit_buy_price_1 = QtWidgets.QLineEdit(self.frame_buy_content)
-        self.lineEdit_buy_price_1.setGeometry(160, 27, 75, 22)  # Y位置从22调整为27
-        self.lineEdit_buy_price_1.setText("120.8")  # 设置默认价格
-        
-        self.lineEdit_buy_qty_1 = QtWidgets.QLineEdit(self.frame_buy_content)
-        self.lineEdit_buy_qty_1.setGeometry(240, 27, 75, 22)  # Y位置从22调整为27
-        self.lineEdit_buy_qty_1.setText("5000")  # 设置默认股数
-        
-        # Row 2 controls - 适中输入框
-        self.lineEdit_buy_symbol_2 = QtWidgets.QLineEdit(self.frame_buy_content)
-        self.lineEdit_buy_symbol_2.setGeometry(10, 55, 75, 22)  # Y位置从50调整为55
-        self.lineEdit_buy_symbol_2.setText("000002")  # 设置默认股票代码
-        
-        self.label_buy_name_2 = QtWidgets.QLabel("万科A", self.frame_buy_content)
-        self.label_buy_name_2.setGeometry(85, 55, 70, 22)  # X位置从95调整为85，宽度从60调整为70
-        
-        self.lineEdit_buy_price_2 = QtWidgets.QLineEdit(self.frame_buy_content)
-        self.lineEdit_buy_price_2.setGeometry(160, 55, 75, 22)  # Y位置从50调整为55
-        self.lineEdit_buy_price_2.setText("20.88")  # 设置默认价格
-        
-        self.lineEdit_buy_qty_2 = QtWidgets.QLineEdit(self.frame_buy_content)
-        self.lineEdit_buy_qty_2.setGeometry(240, 55, 75, 22)  # Y位置从50调整为55
-        self.lineEdit_buy_qty_2.setText("28920")  # 设置默认股数
-        
-        # SpinBox - 适中尺寸
-        self.spinBox_buy = QtWidgets.QSpinBox(self.frame_buy_content)
-        self.spinBox_buy.setGeometry(325, 40, 85, 23)  # Y位置从35调整为40
-        self.spinBox_buy.setValue(1)
-        
-        # Time selection group - 调整位置避免与spinBox重叠
-        self.groupBox_buy_time = QtWidgets.QGroupBox("时间", self.frame_buy_content)
-        self.groupBox_buy_time.setGeometry(420, 5, 80, 75)  # Y位置从0调整为5
-        
-        self.radioButton_buy_time_1 = QtWidgets.QRadioButton("1", self.groupBox_buy_time)
-        self.radioButton_buy_time_1.setGeometry(8, 22, 30, 22)  # Y位置保持22（相对于groupBox）
-        
-        self.radioButton_buy_time_2 = QtWidgets.QRadioButton("2", self.groupBox_buy_time)
-        self.radioButton_buy_time_2.setGeometry(42, 22, 30, 22)  # Y位置保持22（相对于groupBox）
-        self.radioButton_buy_time_2.setChecked(True)
-        
-        self.radioButton_buy_time_3 = QtWidgets.QRadioButton("3", self.groupBox_buy_time)
-        self.radioButton_buy_time_3.setGeometry(8, 45, 30, 22)  # Y位置保持45（相对于groupBox）
-        
-        self.radioButton_buy_time_5 = QtWidgets.QRadioButton("5", self.groupBox_buy_time)
-        self.radioButton_buy_time_5.setGeometry(42, 45, 30, 22)  # Y位置保持45（相对于groupBox）
-        
-        # Buy order button - 调整位置
-        self.pushButton_buy_order = QtWidgets.QPushButton("下单", self.frame_buy_content)
-        self.pushButton_buy_order.setGeometry(510, 27, 60, 45)  # Y位置从22调整为27
-        font = QtGui.QFont()
-        font.setBold(True)
-        self.pushButton_buy_order.setFont(font)
-        self.pushButton_buy_order.clicked.connect(self.on_buy_order_clicked)
-
-    def init_sell_section(self) -> None:
-        """Initialize sell (出货) section."""
-        # Sell header frame - 调整位置和尺寸
-        self.frame_sell_header = QtWidgets.QFrame(self)
-        self.frame_sell_header.setGeometry(605, 10, 600, 35)  # 高度从30调整为35
-        self.frame_sell_header.setFrameShape(QtWidgets.QFrame.Shape.Panel)
-        self.frame_sell_header.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        
-        # Sell label
-        self.label_sell = QtWidgets.QLabel("出货", self.frame_sell_header)
-        self.label_sell.setGeometry(10, 2, 75, 30)  # Y位置从0调整为2，增加顶部间距
-        font = QtGui.QFont()
-        font.setPointSize(16)  # 字体大小调整为16
-        font.setBold(True)
-        self.label_sell.setFont(font)
-        self.label_sell.setStyleSheet("color: rgb(85, 0, 255);")
-        
-        # Sell add button
-        self.pushButton_sell_add = QtWidgets.QPushButton("增加", self.frame_sell_header)
-        self.pushButton_sell_add.setGeometry(520, 2, 70, 30)  # Y位置从0调整为2，与标签对齐
-        font = QtGui.QFont()
-        font.setPointSize(9)  # 字体稍小
-        font.setBold(True)
-        self.pushButton_sell_add.setFont(font)
-        self.pushButton_sell_add.clicked.connect(self.on_sell_add_clicked)
-        
-        # Sell main frame - 增加高度避免边框被覆盖
-        self.frame_sell_main = QtWidgets.QFrame(self)
-        self.frame_sell_main.setGeometry(605, 50, 600, 120)  # Y位置从45调整为50，适应更高的header
-        self.frame_sell_main.setFrameShape(QtWidgets.QFrame.Shape.Panel)
-        
-        # Sell content frame
-        self.frame_sell_content = QtWidgets.QFrame(self.frame_sell_main)
-        self.frame_sell_content.setGeometry(10, 10, 580, 100)  # 宽度从575调整为580
-        self.frame_sell_content.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        
-        # Sell input controls
-        self.init_sell_controls()
-
-    def init_sell_controls(self) -> None:
-        """Initialize sell section controls."""
-        # Headers - 调整标题控件宽度以显示完整文字，并居中对齐到编辑框（与买入区域保持一致）
-        QtWidgets.QLabel("代码", self.frame_sell_content).setGeometry(25, 5, 45, 18)  # 保持原位置
-        QtWidgets.QLabel("价格", self.frame_sell_content).setGeometry(175, 5, 45, 18)  # X位置调整为175，居中对齐价格编辑框
-        QtWidgets.QLabel("股数", self.frame_sell_content).setGeometry(255, 5, 45, 18)  # X位置调整为255，居中对齐股数编辑框
-        
-        # Row 1 controls - 适中输入框（与买入区域保持一致）
-        self.lineEdit_sell_symbol_1 = QtWidgets.QLineEdit(self.frame_sell_content)
-        self.lineEdit_sell_symbol_1.setGeometry(10, 27, 75, 22)  # Y位置从22调整为27
-        self.lineEdit_sell_symbol_1.setText("600000")  # 设置默认股票代码
-        
-        self.label_sell_name_1 = QtWidgets.QLabel("浦发银行", self.frame_sell_content)
-        self.label_sell_name_1.setGeometry(85, 27, 70, 22)  # X位置从95调整为85，宽度从60调整为70
-        
-        self.lineEdit_sell_price_1 = QtWidgets.QLineEdit(self.frame_sell_content)
-        self.lineEdit_sell_price_1.setGeometry(160, 27, 75, 22)  # Y位置从22调整为27
-        self.lineEdit_sell_price_1.setText("120.8")  # 设置默认价格
-        
-        self.lineEdit_sell_qty_1 = QtWidgets.QLineEdit(self.frame_sell_content)
-        self.lineEdit_sell_qty_1.setGeometry(240, 27, 75, 22)  # Y位置从22调整为27
-        self.lineEdit_sell_qty_1.setText("5000")  # 设置默认股数
-        
-        # Row 2 controls - 适中输入框（与买入区域保持一致）
-        self.lineEdit_sell_symbol_2 = QtWidgets.QLineEdit(self.frame_sell_content)
-        self.lineEdit_sell_symbol_2.setGeometry(10, 55, 75, 22)  # Y位置从50调整为55
-        self.lineEdit_sell_symbol_2.setText("000002")  # 设置默认股票代码
-        
-        self.label_sell_name_2 = QtWidgets.QLabel("万科A", self.frame_sell_content)
-        self.label_sell_name_2.setGeometry(85, 55, 70, 22)  # X位置从95调整为85，宽度从60调整为70
-        
-        self.lineEdit_sell_price_2 = QtWidgets.QLineEdit(self.frame_sell_content)
-        self.lineEdit_sell_price_2.setGeometry(160, 55, 75, 22)  # Y位置从50调整为55
-        self.lineEdit_sell_price_2.setText("20.88")  # 设置默认价格
-        
-        self.lineEdit_sell_qty_2 = QtWidgets.QLineEdit(self.frame_sell_content)
-        self.lineEdit_sell_qty_2.setGeometry(240, 55, 75, 22)  # Y位置从50调整为55
-        self.lineEdit_sell_qty_2.setText("28920")  # 设置默认股数
-        
-        # SpinBox - 适中数量选择器
-        self.spinBox_sell = QtWidgets.QSpinBox(self.frame_sell_content)
-        self.spinBox_sell.setGeometry(325, 40, 85, 23)  # Y位置从35调整为40
-        self.spinBox_sell.setValue(1)
-        
-        # Time selection group - 调整位置避免与spinBox重叠
-        self.groupBox_sell_time = QtWidgets.QGroupBox("时间", self.frame_sell_content)
-        self.groupBox_sell_time.setGeometry(420, 5, 80, 75)  # Y位置从0调整为5
-        
-        self.radioButton_sell_time_1 = QtWidgets.QRadioButton("1", self.groupBox_sell_time)
-        self.radioButton_sell_time_1.setGeometry(8, 22, 30, 22)  # Y位置保持22（相对于groupBox）
-        
-        self.radioButton_sell_time_2 = QtWidgets.QRadioButton("2", self.groupBox_sell_time)
-        self.radioButton_sell_time_2.setGeometry(42, 22, 30, 22)  # Y位置保持22（相对于groupBox）
-        self.radioButton_sell_time_2.setChecked(True)
-        
-        self.radioButton_sell_time_3 = QtWidgets.QRadioButton("3", self.groupBox_sell_time)
-        self.radioButton_sell_time_3.setGeometry(8, 45, 30, 22)  # Y位置保持45（相对于groupBox）
-        
-        self.radioButton_sell_time_5 = QtWidgets.QRadioButton("5", self.groupBox_sell_time)
-        self.radioButton_sell_time_5.setGeometry(42, 45, 30, 22)  # Y位置保持45（相对于groupBox）
-        
-        # Sell order button - 调整位置
-        self.pushButton_sell_order = QtWidgets.QPushButton("下单", self.frame_sell_content)
-        self.pushButton_sell_order.setGeometry(510, 27, 60, 45)  # Y位置从22调整为27
-        font = QtGui.QFont()
-        font.setBold(True)
-        self.pushButton_sell_order.setFont(font)
-        self.pushButton_sell_order.clicked.connect(self.on_sell_order_clicked)
+
+        # Widgets of each side, e.g. self.edits["buy"]["price"][row]
+        self.edits: dict[str, dict[str, list[QtWidgets.QLineEdit]]] = {}
+        self.name_labels: dict[str, list[QtWidgets.QLabel]] = {}
+        self.spin_boxes: dict[str, QtWidgets.QSpinBox] = {}
+        self.time_groups: dict[str, QtWidgets.QButtonGroup] = {}
+
+        # Reject invalid keystrokes in price and quantity edits
+        locale: QtCore.QLocale = QtCore.QLocale.c()
+        locale.setNumberOptions(QtCore.QLocale.NumberOption.RejectGroupSeparator)
+
+        self.price_validator: QtGui.QDoubleValidator = QtGui.QDoubleValidator(0.0, 1e7, 4, self)
+        self.price_validator.setNotation(QtGui.QDoubleValidator.Notation.StandardNotation)
+        self.price_validator.setLocale(locale)
+
+        self.qty_validator: QtGui.QIntValidator = QtGui.QIntValidator(0, 10_000_000, self)
+        self.qty_validator.setLocale(locale)
+
+        # Panel borders and side titles painted directly on the widget
+        self._panels: list[QtCore.QRect] = []
+        self._titles: list[tuple[QtCore.QRect, str, QtGui.QPen]] = []
+
+        # Create all child widgets with updates disabled, caller shows the widget
+        self.setUpdatesEnabled(False)
+        self._init_side("buy", "进货", 0, QtGui.QColor(255, 0, 0), self.on_buy_add_clicked)
+        self._init_side("sell", "出货", 605, QtGui.QColor(85, 0, 255), self.on_sell_add_clicked)
+        self.init_toast()
+        self.setUpdatesEnabled(True)
+
+        # Fix size after all children are created, so geometry is computed once
+        self.setFixedSize(1210, 175)
+
+    def _init_side(
+        self,
+        side: str,
+        title: str,
+        x_offset: int,
+        color: QtGui.QColor,
+        on_add: Callable[[], None]
+    ) -> None:
+        """Initialize buy (进货) or sell (出货) section."""
+        # Header panel and title text are painted in paintEvent
+        self._panels.append(QtCore.QRect(x_offset, 10, 599, 34))
+        self._panels.append(QtCore.QRect(x_offset, 50, 599, 119))
+        self._titles.append((QtCore.QRect(x_offset + 18, 12, 75, 30), title, QtGui.QPen(color)))
+
+        add_button: QtWidgets.QPushButton = QtWidgets.QPushButton("增加", self)
+        add_button.setGeometry(x_offset + 520, 12, 70, 30)
+        add_button.setFont(self._FONT_BTN_9B)
+        add_button.clicked.connect(on_add)
+
+        # Content frame holding input controls
+        content: QtWidgets.QFrame = QtWidgets.QFrame(self)
+        content.setGeometry(x_offset + 10, 60, 580, 100)
+        content.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+
+        # Headers are centered above their edits
+        center: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter
+
+        grid: QtWidgets.QGridLayout = QtWidgets.QGridLayout(content)
+        grid.setContentsMargins(10, 5, 10, 5)
+        grid.addWidget(QtWidgets.QLabel("代码"), 0, 0, center)
+        grid.addWidget(QtWidgets.QLabel("价格"), 0, 2, center)
+        grid.addWidget(QtWidgets.QLabel("股数"), 0, 3, center)
+
+        # Stock rows: symbol, name, price, quantity
+        edits: dict[str, list[QtWidgets.QLineEdit]] = {"symbol": [], "price": [], "qty": []}
+        name_labels: list[QtWidgets.QLabel] = []
+
+        for row, (symbol, name, price, qty) in enumerate(ROW_DEFAULTS, start=1):
+            symbol_edit: QtWidgets.QLineEdit = QtWidgets.QLineEdit(symbol)
+            name_label: QtWidgets.QLabel = QtWidgets.QLabel(name)
+            price_edit: QtWidgets.QLineEdit = QtWidgets.QLineEdit(price)
+            qty_edit: QtWidgets.QLineEdit = QtWidgets.QLineEdit(qty)
+
+            price_edit.setValidator(self.price_validator)
+            qty_edit.setValidator(self.qty_validator)
+
+            grid.addWidget(symbol_edit, row, 0)
+            grid.addWidget(name_label, row, 1)
+            grid.addWidget(price_edit, row, 2)
+            grid.addWidget(qty_edit, row, 3)
+
+            edits["symbol"].append(symbol_edit)
+            edits["price"].append(price_edit)
+            edits["qty"].append(qty_edit)
+            name_labels.append(name_label)
+
+        self.edits[side] = edits
+        self.name_labels[side] = name_labels
+
+        # Number of rows to send orders
+        spin_box: QtWidgets.QSpinBox = QtWidgets.QSpinBox()
+        spin_box.setValue(1)
+        grid.addWidget(spin_box, 1, 4, 2, 1)
+        self.spin_boxes[side] = spin_box
+
+        # Time selection group
+        time_box: QtWidgets.QGroupBox = QtWidgets.QGroupBox("时间")
+        time_grid: QtWidgets.QGridLayout = QtWidgets.QGridLayout(time_box)
+        time_grid.setContentsMargins(6, 14, 6, 2)
+        time_group: QtWidgets.QButtonGroup = QtWidgets.QButtonGroup(self)
+
+        for i, interval in enumerate(TIME_INTERVALS):
+            radio: QtWidgets.QRadioButton = QtWidgets.QRadioButton(str(interval))
+            time_grid.addWidget(radio, i // 2, i % 2)
+            time_group.addButton(radio, interval)
+
+        time_group.button(2).setChecked(True)
+        grid.addWidget(time_box, 0, 5, 3, 1)
+        self.time_groups[side] = time_group
+
+        # Order button
+        order_button: QtWidgets.QPushButton = QtWidgets.QPushButton("下单")
+        order_button.setMinimumHeight(45)
+        order_button.setFont(self._FONT_BOLD)
+        order_button.clicked.connect(lambda: self._submit_side(side))
+        grid.addWidget(order_button, 1, 6, 2, 1)
+
+        for column, width in enumerate((75, 70, 75, 75, 85, 80, 60)):
+            grid.setColumnMinimumWidth(column, width)
+
+    def init_toast(self) -> None:
+        """Create transient label for showing errors without blocking event loop."""
+        self._status: QtWidgets.QLabel = QtWidgets.QLabel(self)
+        self._status.setGeometry(0, 155, 1210, 20)
+        self._status.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self._status.setStyleSheet("color: white; background-color: rgb(170, 0, 0);")
+        self._status.hide()
+
+        self._status_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(2500)
+        self._status_timer.timeout.connect(self._status.hide)
+
+    def _show_toast(self, msg: str) -> None:
+        """Show error message for a while, the timer restarts on each new message."""
+        self._status.setText(msg)
+        self._status.show()
+        self._status.raise_()
+        self._status_timer.start()
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        """Paint panel borders and side titles instead of using extra frames."""
+        painter: QtGui.QPainter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(self.palette().color(QtGui.QPalette.ColorRole.Dark))
+        for rect in self._panels:
+            painter.drawRoundedRect(rect, 4, 4)
+
+        painter.setFont(self._FONT_HEADER_16B)
+        for rect, title, pen in self._titles:
+            painter.setPen(pen)
+            painter.drawText(rect, QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, title)
+
+        painter.end()
+
+    def init_symbol_index(self) -> None:
+        """Cache symbol text of each row and keep it updated by textChanged."""
+        for side_index, side in enumerate(SIDES):
+            for row, symbol_edit in enumerate(self.edits[side]["symbol"]):
+                self.stocks[side_index][row].symbol = symbol_edit.text().strip()
+                symbol_edit.textChanged.connect(partial(self._on_symbol_changed, side_index, row))
+
+        self._rebuild_symbol_index()
+
+    def _on_symbol_changed(self, side_index: int, row: int, text: str) -> None:
+        """Update cached symbol of the row and rebuild the symbol index."""
+        self.stocks[side_index][row].symbol = text.strip()
+        self._rebuild_symbol_index()
+
+    def _rebuild_symbol_index(self) -> None:
+        """Rebuild symbol to price edits mapping from cached row symbols."""
+        self._symbol_to_targets.clear()
+        self._last_price.clear()
+
+        for side_index, side in enumerate(SIDES):
+            price_edits: list[QtWidgets.QLineEdit] = self.edits[side]["price"]
+
+            for stock, price_edit in zip(self.stocks[side_index], price_edits, strict=True):
+                if stock.symbol:
+                    self._symbol_to_targets.setdefault(stock.symbol, []).append((price_edit, price_edit.setText))
+
+    def init_timer(self) -> None:
+        """Start timer for flushing coalesced tick prices into UI."""
+        self._flush_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(80)
+        self._flush_timer.setSingleShot(False)
+        self._flush_timer.timeout.connect(self._flush_prices)
+        self._flush_timer.start()
 
     def register_event(self) -> None:
         """Register event handlers."""
-        self.signal_tick.connect(self.process_tick_event)
-        self.event_engine.register(EVENT_TICK, self.signal_tick.emit)
+        # EventEngine calls handlers from its own worker thread, so a Qt signal
+        # with DirectConnection would touch widgets off the GUI thread. The handler
+        # is registered directly and only stores prices under a lock, widgets are
+        # updated by the flush timer on the GUI thread.
+        #
+        # Keep the exact callable registered, so that it can be unregistered on close
+        self._tick_handler: Callable[[Event], None] = self.process_tick_event
+        self.event_engine.register(EVENT_TICK, self._tick_handler)
 
     def process_tick_event(self, event: Event) -> None:
-        """Process tick data event to update prices."""
+        """
+        Keep latest price of each symbol, UI is updated by flush timer.
+
+        Called directly from event engine thread, so no widget is touched here.
+        """
         tick: TickData = event.data
-        
-        # Update buy section prices
-        if tick.symbol == self.lineEdit_buy_symbol_1.text():
-            self.lineEdit_buy_price_1.setText(str(tick.last_price))
-        elif tick.symbol == self.lineEdit_buy_symbol_2.text():
-            self.lineEdit_buy_price_2.setText(str(tick.last_price))
-            
-        # Update sell section prices
-        if tick.symbol == self.lineEdit_sell_symbol_1.text():
-            self.lineEdit_sell_price_1.setText(str(tick.last_price))
-        elif tick.symbol == self.lineEdit_sell_symbol_2.text():
-            self.lineEdit_sell_price_2.setText(str(tick.last_price))
+
+        with self._pending_lock:
+            self._pending_prices[tick.symbol] = tick.last_price
+
+    def _flush_prices(self) -> None:
+        """Write pending tick prices into price edits."""
+        with self._pending_lock:
+            if not self._pending_prices:
+                return
+            pending_prices: dict[str, float] = self._pending_prices
+            self._pending_prices = {}
+
+        targets_map: dict = self._symbol_to_targets
+        last_price: dict[QtWidgets.QLineEdit, float] = self._last_price
+
+        for symbol, price in pending_prices.items():
+            targets: list | None = targets_map.get(symbol, None)
+            if not targets:
+                continue
+
+            for price_edit, set_text in targets:
+                if last_price.get(price_edit, None) == price:
+                    continue
+
+                set_text(_fmt_price(price))
+                last_price[price_edit] = price
 
     def get_selected_time_interval(self, section: str) -> int:
         """Get selected time interval for the given section."""
-        if section == "buy":
-            if self.radioButton_buy_time_1.isChecked():
-                return 1
-            elif self.radioButton_buy_time_2.isChecked():
-                return 2
-            elif self.radioButton_buy_time_3.isChecked():
-                return 3
-            elif self.radioButton_buy_time_5.isChecked():
-                return 5
-        elif section == "sell":
-            if self.radioButton_sell_time_1.isChecked():
-                return 1
-            elif self.radioButton_sell_time_2.isChecked():
-                return 2
-            elif self.radioButton_sell_time_3.isChecked():
-                return 3
-            elif self.radioButton_sell_time_5.isChecked():
-                return 5
-        return 2  # Default
+        group: QtWidgets.QButtonGroup | None = self.time_groups.get(section, None)
+        if not group:
+            return 2  # Default
+
+        interval: int = group.checkedId()
+        if interval < 0:
+            return 2  # Default
+        return interval
 
     def send_order(self, symbol: str, price: float, quantity: int, direction: Direction) -> None:
         """Send order to the trading system."""
         if not symbol or price <= 0 or quantity <= 0:
-            QtWidgets.QMessageBox.warning(self, "错误", "请输入有效的交易参数")
+            self._show_toast("请输入有效的交易参数")
             return
             
         # Create order request
@@ -342,7 +393,28 @@ class TradingAssistantWidget(QtWidgets.QWidget):
                     f"订单号: {vt_orderid}"
                 )
         else:
-            QtWidgets.QMessageBox.warning(self, "错误", "没有可用的交易接口")
+            self._show_toast("没有可用的交易接口")
+
+    def _read_row(self, side: str, row: int) -> tuple[str, float, int] | None:
+        """
+        Read symbol, price and quantity of a stock row.
+
+        Return None if price or quantity is not accepted by its validator,
+        empty text is read as zero.
+        """
+        edits: dict[str, list[QtWidgets.QLineEdit]] = self.edits[side]
+        price_text: str = edits["price"][row].text()
+        qty_text: str = edits["qty"][row].text()
+
+        if price_text and not edits["price"][row].hasAcceptableInput():
+            return None
+        if qty_text and not edits["qty"][row].hasAcceptableInput():
+            return None
+
+        symbol: str = edits["symbol"][row].text().strip()
+        price: float = float(price_text) if price_text else 0
+        quantity: int = int(qty_text) if qty_text else 0
+        return symbol, price, quantity
 
     def on_buy_add_clicked(self) -> None:
         """Handle buy add button click."""
@@ -352,74 +424,36 @@ class TradingAssistantWidget(QtWidgets.QWidget):
         """Handle sell add button click."""
         QtWidgets.QMessageBox.information(self, "功能", "卖出增加功能")
 
-    def on_buy_order_clicked(self) -> None:
-        """Handle buy order button click."""
-        # Get selected time interval
-        time_interval = self.get_selected_time_interval("buy")
-        
-        # Process buy orders based on spinbox value
-        spinbox_value = self.spinBox_buy.value()
-        
-        if spinbox_value >= 1:
-            # Process first buy order
-            symbol = self.lineEdit_buy_symbol_1.text().strip()
-            try:
-                price = float(self.lineEdit_buy_price_1.text() or "0")
-                quantity = int(self.lineEdit_buy_qty_1.text() or "0")
-                if symbol and price > 0 and quantity > 0:
-                    self.send_order(symbol, price, quantity, Direction.LONG)
-            except ValueError:
-                QtWidgets.QMessageBox.warning(self, "错误", "第一行买入参数格式错误")
-                
-        if spinbox_value >= 2:
-            # Process second buy order
-            symbol = self.lineEdit_buy_symbol_2.text().strip()
-            try:
-                price = float(self.lineEdit_buy_price_2.text() or "0")
-                quantity = int(self.lineEdit_buy_qty_2.text() or "0")
-                if symbol and price > 0 and quantity > 0:
-                    self.send_order(symbol, price, quantity, Direction.LONG)
-            except ValueError:
-                QtWidgets.QMessageBox.warning(self, "错误", "第二行买入参数格式错误")
-
-    def on_sell_order_clicked(self) -> None:
-        """Handle sell order button click."""
-        # Get selected time interval
-        time_interval = self.get_selected_time_interval("sell")
-        
-        # Process sell orders based on spinbox value
-        spinbox_value = self.spinBox_sell.value()
-        
-        if spinbox_value >= 1:
-            # Process first sell order
-            symbol = self.lineEdit_sell_symbol_1.text().strip()
-            try:
-                price = float(self.lineEdit_sell_price_1.text() or "0")
-                quantity = int(self.lineEdit_sell_qty_1.text() or "0")
-                if symbol and price > 0 and quantity > 0:
-                    self.send_order(symbol, price, quantity, Direction.SHORT)
-            except ValueError:
-                QtWidgets.QMessageBox.warning(self, "错误", "第一行卖出参数格式错误")
-                
-        if spinbox_value >= 2:
-            # Process second sell order
-            symbol = self.lineEdit_sell_symbol_2.text().strip()
-            try:
-                price = float(self.lineEdit_sell_price_2.text() or "0")
-                quantity = int(self.lineEdit_sell_qty_2.text() or "0")
-                if symbol and price > 0 and quantity > 0:
-                    self.send_order(symbol, price, quantity, Direction.SHORT)
-            except ValueError:
-                QtWidgets.QMessageBox.warning(self, "错误", "第二行卖出参数格式错误")
-
-    def closeEvent(self, event) -> None:
+    def _submit_side(self, side: str) -> None:
+        """Send orders of the first N rows of a side, N is set by its spin box."""
+        if side == "buy":
+            direction: Direction = Direction.LONG
+            direction_text: str = "买入"
+        else:
+            direction = Direction.SHORT
+            direction_text = "卖出"
+
+        row_count: int = min(self.spin_boxes[side].value(), len(ROW_DEFAULTS))
+
+        for row in range(row_count):
+            order: tuple[str, float, int] | None = self._read_row(side, row)
+            if order is None:
+                self._show_toast(f"第{row + 1}行{direction_text}参数格式错误")
+                continue
+
+            symbol, price, quantity = order
+            if symbol and price > 0 and quantity > 0:
+                self.send_order(symbol, price, quantity, direction)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """Handle window close event."""
         # Unregister event handlers
-        if hasattr(self, 'event_engine') and self.event_engine:
-            try:
-                self.event_engine.unregister(EVENT_TICK, self.signal_tick.emit)
-            except:
-                pass
-        
-        # Clean up resources if needed
+        self.event_engine.unregister(EVENT_TICK, self._tick_handler)
+
+        # Stop flushing and drop prices received before unregister
+        self._flush_timer.stop()
+
+        with self._pending_lock:
+            self._pending_prices.clear()
+
         super().closeEvent(event)
\ No newline at end of file
@@ -4,6 +4,7 @@ Implements main window of the trading platform.
 
 from types import ModuleType
 import webbrowser
+import weakref
 from functools import partial
 from importlib import import_module
 from typing import TypeVar
@@ -97,8 +98,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.save_window_setting("default")
 
-        self.tick_widget.itemDoubleClicked.connect(self.trading_widget.update_with_cell)
-        position_widget.itemDoubleClicked.connect(self.trading_widget.update_with_cell)
+        self.tick_widget.data_double_clicked.connect(self.trading_widget.update_with_data)
+        position_widget.data_double_clicked.connect(self.trading_widget.update_with_data)
 
     def init_menu(self) -> None:
         """"""
@@ -330,14 +331,15 @@ class MainWindow(QtWidgets.QMainWindow):
         
         widget = StockTradingWidget(self.main_engine, self.event_engine)
         widget._widget_name = name  # Store the name for cleanup
+        widget._main_window_ref = weakref.ref(self)
         widget.setWindowTitle(f"股票交易 - {timestamp[-6:]}")  # Add unique identifier to title
         
         # Get selected tick data from tick monitor and update stock trading widget
         if hasattr(self, 'tick_widget') and self.tick_widget:
-            current_item = self.tick_widget.currentItem()
-            if current_item:
+            current_data = self.tick_widget.current_data()
+            if current_data:
                 # Update the stock trading widget with selected tick data
-                widget.update_with_cell(current_item)
+                widget.update_with_data(current_data)
         
         self.widgets[name] = widget
         widget.show()
@@ -368,6 +370,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         widget = Level2Widget(self.main_engine, self.event_engine)
         widget._widget_name = name  # Store the name for cleanup
+        widget._main_window_ref = weakref.ref(self)
         widget.setWindowTitle(f"Level-2 十档行情 - {timestamp[-6:]}")  # Add unique identifier to title
         self.widgets[name] = widget
         widget.show()
@@ -2,14 +2,19 @@
 Basic widgets for UI.
 """
 
-import csv
-import platform
 from enum import Enum
 from typing import cast, Any
+from collections.abc import Callable, Sequence
 from copy import copy
+from operator import attrgetter
+from functools import lru_cache
 from tzlocal import get_localzone_name
 from datetime import datetime
-from importlib import metadata
+from collections import deque
+from threading import Thread, Lock
+from sys import intern
+
+import numpy as np
 
 from .qt import QtCore, QtGui, QtWidgets, Qt
 from ..constant import Direction, Exchange, Offset, OrderType
@@ -21,7 +26,8 @@ from ..event import (
     EVENT_ORDER,
     EVENT_POSITION,
     EVENT_ACCOUNT,
-    EVENT_LOG
+    EVENT_LOG,
+    EVENT_CONTRACT
 )
 from ..object import (
     OrderRequest,
@@ -43,6 +49,34 @@ COLOR_SHORT = QtGui.QColor("green")
 COLOR_BID = QtGui.QColor(255, 174, 201)
 COLOR_ASK = QtGui.QColor(160, 255, 160)
 COLOR_BLACK = QtGui.QColor("black")
+COLOR_UP = QtGui.QColor(255, 0, 0)
+COLOR_DOWN = QtGui.QColor(0, 170, 0)
+COLOR_FLAT = QtGui.QColor(255, 255, 255)
+
+# Brushes and alignments are shared by all cells instead of being
+# rebuilt from colors and flags each time one is painted.
+BRUSH_LONG = QtGui.QBrush(COLOR_LONG)
+BRUSH_SHORT = QtGui.QBrush(COLOR_SHORT)
+BRUSH_BID = QtGui.QBrush(COLOR_BID)
+BRUSH_ASK = QtGui.QBrush(COLOR_ASK)
+BRUSH_BLACK = QtGui.QBrush(COLOR_BLACK)
+BRUSH_UP = QtGui.QBrush(COLOR_UP)
+BRUSH_DOWN = QtGui.QBrush(COLOR_DOWN)
+BRUSH_FLAT = QtGui.QBrush(COLOR_FLAT)
+
+BRUSH_BG_UP = QtGui.QBrush(QtGui.QColor(200, 0, 0))
+BRUSH_BG_DOWN = QtGui.QBrush(QtGui.QColor(0, 150, 0))
+
+# Price brushes indexed by sign of price against pre close plus one
+PRICE_BRUSHES: np.ndarray = np.array([BRUSH_DOWN, BRUSH_FLAT, BRUSH_UP], dtype=object)
+
+ALIGN_CENTER = int(Qt.AlignmentFlag.AlignCenter)
+ALIGN_LEFT = int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+
+# Invalid index used as default parent of table models
+ROOT_INDEX = QtCore.QModelIndex()
+
+LOCAL_TZ: ZoneInfo = ZoneInfo(get_localzone_name())
 
 
 class BaseCell(QtWidgets.QTableWidgetItem):
@@ -50,6 +84,10 @@ class BaseCell(QtWidgets.QTableWidgetItem):
     General cell used in tablewidgets.
     """
 
+    # No __slots__ here: with PySide6 6.8 any subclass of a slotted
+    # QTableWidgetItem crashes on first slot access, and cells are meant
+    # to be subclassed. Monitors no longer create cells at all.
+
     def __init__(self, content: Any, data: Any) -> None:
         """"""
         super().__init__()
@@ -117,9 +155,9 @@ class DirectionCell(EnumCell):
         super().set_content(content, data)
 
         if content is Direction.SHORT:
-            self.setForeground(COLOR_SHORT)
+            self.setForeground(BRUSH_SHORT)
         else:
-            self.setForeground(COLOR_LONG)
+            self.setForeground(BRUSH_LONG)
 
 
 class BidCell(BaseCell):
@@ -131,7 +169,7 @@ class BidCell(BaseCell):
         """"""
         super().__init__(content, data)
 
-        self.setForeground(COLOR_BID)
+        self.setForeground(BRUSH_BID)
 
 
 class AskCell(BaseCell):
@@ -143,7 +181,7 @@ class AskCell(BaseCell):
         """"""
         super().__init__(content, data)
 
-        self.setForeground(COLOR_ASK)
+        self.setForeground(BRUSH_ASK)
 
 
 class PnlCell(BaseCell):
@@ -162,10 +200,10 @@ class PnlCell(BaseCell):
         """
         super().set_content(content, data)
 
-        if str(content).startswith("-"):
-            self.setForeground(COLOR_SHORT)
+        if content < 0:
+            self.setForeground(BRUSH_SHORT)
         else:
-            self.setForeground(COLOR_LONG)
+            self.setForeground(BRUSH_LONG)
 
 
 class TimeCell(BaseCell):
@@ -173,7 +211,7 @@ class TimeCell(BaseCell):
     Cell used for showing time string from datetime object.
     """
 
-    local_tz = ZoneInfo(get_localzone_name())
+    local_tz = LOCAL_TZ
 
     def __init__(self, content: Any, data: Any) -> None:
         """"""
@@ -184,16 +222,7 @@ class TimeCell(BaseCell):
         if content is None:
             return
 
-        content = content.astimezone(self.local_tz)
-        timestamp: str = content.strftime("%H:%M:%S")
-
-        millisecond: int = int(content.microsecond / 1000)
-        if millisecond:
-            timestamp = f"{timestamp}.{millisecond}"
-        else:
-            timestamp = f"{timestamp}.000"
-
-        self.setText(timestamp)
+        self.setText(format_timestamp(content))
         self._data = data
 
 
@@ -226,7 +255,408 @@ class MsgCell(BaseCell):
         self.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
 
 
-class BaseMonitor(QtWidgets.QTableWidget):
+def format_base(content: Any) -> tuple[str, QtGui.QBrush | None]:
+    """"""
+    return str(content), None
+
+
+# Enum members are a small fixed set, so their display text is cached by
+# member on first use instead of reading .value on every update.
+ENUM_TEXTS: dict[Any, str] = {None: ""}
+
+DIRECTION_STYLES: dict[Any, tuple[str, QtGui.QBrush]] = {
+    direction: (direction.value, BRUSH_SHORT if direction is Direction.SHORT else BRUSH_LONG)
+    for direction in Direction
+}
+
+
+def format_enum(content: Any) -> tuple[str, QtGui.QBrush | None]:
+    """"""
+    text: str | None = ENUM_TEXTS.get(content, None)
+
+    if text is None:
+        text = content.value if content else ""
+        ENUM_TEXTS[content] = text
+
+    return text, None
+
+
+def format_direction(content: Any) -> tuple[str, QtGui.QBrush | None]:
+    """"""
+    style: tuple[str, QtGui.QBrush] | None = DIRECTION_STYLES.get(content, None)
+
+    if style is None:
+        text, __ = format_enum(content)
+        return text, BRUSH_LONG
+    return style
+
+
+def format_bid(content: Any) -> tuple[str, QtGui.QBrush | None]:
+    """"""
+    return str(content), BRUSH_BID
+
+
+def format_ask(content: Any) -> tuple[str, QtGui.QBrush | None]:
+    """"""
+    return str(content), BRUSH_ASK
+
+
+def format_pnl(content: Any) -> tuple[str, QtGui.QBrush | None]:
+    """"""
+    if content < 0:
+        return str(content), BRUSH_SHORT
+    return str(content), BRUSH_LONG
+
+
+def format_timestamp(dt: datetime) -> str:
+    """
+    Convert datetime into HH:MM:SS.mmm string of local time.
+    """
+    # Datetime from gateways usually already carries the local ZoneInfo
+    # instance, so the timezone conversion can be skipped.
+    if dt.tzinfo is not LOCAL_TZ:
+        dt = dt.astimezone(LOCAL_TZ)
+
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond // 1000:03d}"
+
+
+def format_time(content: datetime | None) -> tuple[str, QtGui.QBrush | None]:
+    """"""
+    if content is None:
+        return "", None
+    return format_timestamp(content), None
+
+
+def format_date(content: datetime | None) -> tuple[str, QtGui.QBrush | None]:
+    """"""
+    if content is None:
+        return "", None
+    return content.strftime("%Y-%m-%d"), None
+
+
+# Formatters used by MonitorModel in place of creating cell objects,
+# subclasses of registered cells fall back to their nearest base.
+CELL_FORMATTERS: dict[type, Callable[[Any], tuple[str, QtGui.QBrush | None]]] = {
+    BaseCell: format_base,
+    EnumCell: format_enum,
+    DirectionCell: format_direction,
+    BidCell: format_bid,
+    AskCell: format_ask,
+    PnlCell: format_pnl,
+    TimeCell: format_time,
+    DateCell: format_date,
+    MsgCell: format_base,
+}
+
+
+def get_cell_formatter(cell: type) -> Callable[[Any], tuple[str, QtGui.QBrush | None]]:
+    """
+    Get formatter of cell type defined in monitor headers.
+    """
+    for cls in cell.__mro__:
+        formatter = CELL_FORMATTERS.get(cls, None)
+        if formatter:
+            return formatter
+    return format_base
+
+
+# Order book volumes repeat a small set of values, so their text is cached.
+# Typed so that 100 and 100.0 keep their own str() result.
+@lru_cache(maxsize=8192, typed=True)
+def format_volume(volume: float) -> str:
+    """"""
+    return str(volume)
+
+
+@lru_cache(maxsize=8192)
+def format_volume_grouped(volume: float) -> str:
+    """
+    Convert volume into integer string with thousands separators.
+    """
+    return f"{int(volume):,}"
+
+
+def get_price_brushes(prices: Sequence[float], pre_close: float) -> list[QtGui.QBrush]:
+    """
+    Get up/down/flat brushes of prices compared with pre close price.
+    """
+    signs: np.ndarray = np.sign(np.asarray(prices, dtype=np.float64) - pre_close).astype(np.int8)
+    return cast(list[QtGui.QBrush], PRICE_BRUSHES[signs + 1].tolist())
+
+
+@lru_cache(maxsize=256)
+def get_pricetick_digits(pricetick: float) -> int:
+    """
+    Get decimal digits of pricetick, cached as contracts share few priceticks.
+    """
+    return get_digits(pricetick)
+
+
+@lru_cache(maxsize=256)
+def get_price_format(digits: int) -> Callable[[float], str]:
+    """
+    Get bound format method of price with certain decimal digits.
+    """
+    return f"{{:.{digits}f}}".format
+
+
+class MonitorModel(QtCore.QAbstractTableModel):
+    """
+    Table model holding data objects shown by monitor.
+    """
+
+    def __init__(self, headers: dict, data_key: str, parent: QtCore.QObject | None = None) -> None:
+        """"""
+        super().__init__(parent)
+
+        self.headers: dict = headers
+        self.data_key: str = data_key
+
+        self.labels: list[str] = [d["display"] for d in headers.values()]
+
+        # Getter and formatter of each column are compiled once here,
+        # leaving no dict lookup in the per event update path.
+        self.getters: list[attrgetter] = [attrgetter(header) for header in headers]
+        self.formatters: list = [get_cell_formatter(d["cell"]) for d in headers.values()]
+
+        # Reading all columns with one attrgetter returns a tuple from C,
+        # a single name would return the bare value so it is not used then.
+        if len(headers) > 1:
+            self.row_getter: Callable[[Any], tuple] = attrgetter(*headers)
+        else:
+            self.row_getter = lambda data: tuple(getter(data) for getter in self.getters)
+
+        if data_key:
+            self.key_getter: attrgetter = attrgetter(data_key)
+
+        self.alignments: list[int] = [
+            ALIGN_LEFT if issubclass(d["cell"], MsgCell) else ALIGN_CENTER
+            for d in headers.values()
+        ]
+
+        self.update_columns: set[int] = {
+            column for column, d in enumerate(headers.values()) if d["update"]
+        }
+        self.update_cells: list[tuple[int, attrgetter, Callable]] = [
+            (column, self.getters[column], self.formatters[column])
+            for column in sorted(self.update_columns)
+        ]
+
+        self.rows: list[Any] = []
+        self.texts: list[list[str]] = []
+        self.brushes: list[list[QtGui.QBrush | None]] = []
+
+        # Raw values last shown in update columns of each row, used to
+        # skip cells whose content has not changed.
+        self.update_values: list[list[Any]] = []
+
+        self.key_rows: dict[str, int] = {}
+        self.key_dirty: bool = False
+
+    def rowCount(self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = ROOT_INDEX) -> int:
+        """"""
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = ROOT_INDEX) -> int:
+        """"""
+        if parent.isValid():
+            return 0
+        return len(self.labels)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        """"""
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.texts[index.row()][index.column()]
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            return self.brushes[index.row()][index.column()]
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            return self.alignments[index.column()]
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        """"""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.labels[section]
+        return None
+
+    def format_row(self, data: Any) -> tuple[list[str], list[QtGui.QBrush | None]]:
+        """
+        Convert data object into texts and brushes of each column.
+        """
+        texts: list[str] = []
+        brushes: list[QtGui.QBrush | None] = []
+
+        for value, formatter in zip(self.row_getter(data), self.formatters, strict=True):
+            text, brush = formatter(value)
+            texts.append(text)
+            brushes.append(brush)
+
+        return texts, brushes
+
+    def insert_row(self, data: Any) -> None:
+        """
+        Insert a new row at the top of table.
+        """
+        self.insert_rows([data])
+
+    def insert_rows(self, datas: list[Any]) -> None:
+        """
+        Insert new rows at the top of table, the last one on top.
+        """
+        datas = datas[::-1]
+
+        texts: list[list[str]] = []
+        brushes: list[list[QtGui.QBrush | None]] = []
+        for data in datas:
+            row_texts, row_brushes = self.format_row(data)
+            texts.append(row_texts)
+            brushes.append(row_brushes)
+
+        update_values: list[list[Any]] = [
+            [getter(data) for column, getter, formatter in self.update_cells]
+            for data in datas
+        ]
+
+        self.beginInsertRows(QtCore.QModelIndex(), 0, len(datas) - 1)
+        self.rows[0:0] = datas
+        self.texts[0:0] = texts
+        self.brushes[0:0] = brushes
+        self.update_values[0:0] = update_values
+        self.endInsertRows()
+
+        self.key_dirty = True
+
+    def update_row(self, row: int, data: Any) -> None:
+        """
+        Update columns of an old row which allow update.
+        """
+        if row < 0:
+            raise IndexError(f"Invalid row to update: {row}")
+
+        self.rows[row] = data
+
+        texts: list[str] = self.texts[row]
+        brushes: list[QtGui.QBrush | None] = self.brushes[row]
+        values: list[Any] = self.update_values[row]
+
+        first: int = -1
+        last: int = -1
+
+        for i, (column, getter, formatter) in enumerate(self.update_cells):
+            value: Any = getter(data)
+            if value == values[i]:
+                continue
+
+            values[i] = value
+            texts[column], brushes[column] = formatter(value)
+
+            if first < 0:
+                first = column
+            last = column
+
+        # One emit covering all changed columns, none if nothing changed.
+        if first >= 0:
+            self.dataChanged.emit(
+                self.index(row, first),
+                self.index(row, last),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole]
+            )
+
+    def trim_rows(self, max_rows: int) -> None:
+        """
+        Remove rows at the bottom of table exceeding max_rows.
+        """
+        count: int = len(self.rows)
+        if count <= max_rows:
+            return
+
+        self.beginRemoveRows(QtCore.QModelIndex(), max_rows, count - 1)
+        del self.rows[max_rows:]
+        del self.texts[max_rows:]
+        del self.brushes[max_rows:]
+        del self.update_values[max_rows:]
+        self.endRemoveRows()
+
+        self.key_dirty = True
+
+    def find_row(self, key: str) -> int:
+        """
+        Get row number of data key, -1 if not exists.
+        """
+        if self.key_dirty:
+            key_getter: attrgetter = self.key_getter
+            self.key_rows = {key_getter(data): row for row, data in enumerate(self.rows)}
+            self.key_dirty = False
+
+        return self.key_rows.get(key, -1)
+
+    def get_data(self, row: int) -> Any:
+        """
+        Get data object of row.
+        """
+        return self.rows[row]
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """
+        Sort rows by value of column.
+        """
+        if column < 0 or column >= len(self.labels) or len(self.rows) < 2:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+
+        texts: list[list[str]] = self.texts
+        reverse: bool = order == Qt.SortOrder.DescendingOrder
+
+        # Numeric columns are sorted as one float64 array by numpy,
+        # other columns fall back to text content.
+        getter: attrgetter = self.getters[column]
+        values: list = [getter(data) for data in self.rows]
+
+        new_order: list[int]
+        if all(isinstance(v, int | float) for v in values):
+            array: np.ndarray = np.array(values, dtype=np.float64)
+            if reverse:
+                array = -array
+            new_order = np.argsort(array, kind="stable").tolist()
+        else:
+            new_order = sorted(
+                range(len(texts)),
+                key=lambda row: texts[row][column],
+                reverse=reverse
+            )
+
+        self.rows = [self.rows[row] for row in new_order]
+        self.texts = [texts[row] for row in new_order]
+        self.brushes = [self.brushes[row] for row in new_order]
+        self.update_values = [self.update_values[row] for row in new_order]
+        self.key_dirty = True
+
+        new_rows: list[int] = [0] * len(new_order)
+        for new_row, old_row in enumerate(new_order):
+            new_rows[old_row] = new_row
+
+        old_indexes: list[QtCore.QModelIndex] = self.persistentIndexList()
+        new_indexes: list[QtCore.QModelIndex] = [
+            self.index(new_rows[ix.row()], ix.column()) for ix in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+        self.layoutChanged.emit()
+
+
+class BaseMonitor(QtWidgets.QTableView):
     """
     Monitor data update.
     """
@@ -235,8 +665,9 @@ class BaseMonitor(QtWidgets.QTableWidget):
     data_key: str = ""
     sorting: bool = False
     headers: dict = {}
+    max_rows: int = 0
 
-    signal: QtCore.Signal = QtCore.Signal(Event)
+    data_double_clicked: QtCore.Signal = QtCore.Signal(object)
 
     def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
         """"""
@@ -244,7 +675,11 @@ class BaseMonitor(QtWidgets.QTableWidget):
 
         self.main_engine: MainEngine = main_engine
         self.event_engine: EventEngine = event_engine
-        self.cells: dict[str, dict] = {}
+        self.monitor_model: MonitorModel = MonitorModel(self.headers, self.data_key, self)
+
+        # Events pushed from event engine thread, deque append and popleft
+        # are thread safe so no lock or queued Qt signal is needed.
+        self.pending_events: deque[Event] = deque()
 
         self.init_ui()
         self.load_setting()
@@ -259,16 +694,28 @@ class BaseMonitor(QtWidgets.QTableWidget):
         """
         Initialize table.
         """
-        self.setColumnCount(len(self.headers))
+        self.setModel(self.monitor_model)
+
+        # Fixed row height lets the view paint visible rows only.
+        vertical_header: QtWidgets.QHeaderView = self.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
 
-        labels: list = [d["display"] for d in self.headers.values()]
-        self.setHorizontalHeaderLabels(labels)
+        # Columns are only measured on request, never on each row insert.
+        self.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Interactive)
 
-        self.verticalHeader().setVisible(False)
         self.setEditTriggers(self.EditTrigger.NoEditTriggers)
         self.setAlternatingRowColors(True)
         self.setSortingEnabled(self.sorting)
 
+        self.doubleClicked.connect(self.on_double_clicked)
+
+        # Measuring contents walks every row, so merge repeated requests.
+        self.resize_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(100)
+        self.resize_timer.timeout.connect(self.do_resize_columns)
+
     def init_menu(self) -> None:
         """
         Create right click menu.
@@ -288,70 +735,131 @@ class BaseMonitor(QtWidgets.QTableWidget):
         Register event handler into event engine.
         """
         if self.event_type:
-            self.signal.connect(self.process_event)
-            self.event_engine.register(self.event_type, self.signal.emit)
+            self.timer: QtCore.QTimer = QtCore.QTimer(self)
+            self.timer.setInterval(50)
+            self.timer.timeout.connect(self.flush_events)
+            self.timer.start()
 
-    def process_event(self, event: Event) -> None:
+            self.event_engine.register(self.event_type, self.put_event)
+
+    def put_event(self, event: Event) -> None:
         """
-        Process new data from event and update into table.
+        Cache event in event engine thread until next refresh.
         """
-        # Disable sorting to prevent unwanted error.
-        if self.sorting:
-            self.setSortingEnabled(False)
+        self.pending_events.append(event)
 
-        # Update data into table.
-        data = event.data
+    def flush_events(self) -> None:
+        """
+        Apply cached events into table in UI thread.
+        """
+        pending: deque[Event] = self.pending_events
+        count: int = len(pending)
+        if not count:
+            return
 
-        if not self.data_key:
-            self.insert_new_row(data)
-        else:
-            key: str = data.__getattribute__(self.data_key)
+        events: list[Event] = [pending.popleft() for __ in range(count)]
 
-            if key in self.cells:
-                self.update_old_row(data)
-            else:
-                self.insert_new_row(data)
+        # Only the latest event of each row is applied.
+        if self.data_key:
+            key_getter: attrgetter = self.monitor_model.key_getter
+            latest: dict[Any, Event] = {}
+            for event in events:
+                latest[key_getter(event.data)] = event
+            events = list(latest.values())
 
-        # Enable sorting
-        if self.sorting:
-            self.setSortingEnabled(True)
+        self.process_events(events)
 
-    def insert_new_row(self, data: Any) -> None:
+    def process_events(self, events: list[Event]) -> None:
         """
-        Insert a new row at the top of table.
+        Process a batch of new data from events and update into table.
         """
-        self.insertRow(0)
+        model: MonitorModel = self.monitor_model
+        new_datas: list[Any] = []
+        updated: bool = False
+
+        for event in events:
+            data = event.data
+
+            if self.data_key:
+                row: int = model.find_row(model.key_getter(data))
+                if row >= 0:
+                    model.update_row(row, data)
+                    updated = True
+                    continue
 
-        row_cells: dict = {}
-        for column, header in enumerate(self.headers.keys()):
-            setting: dict = self.headers[header]
+            new_datas.append(data)
 
-            content = data.__getattribute__(header)
-            cell: QtWidgets.QTableWidgetItem = setting["cell"](content, data)
-            self.setItem(0, column, cell)
+        # All new rows are inserted with one model notification, oldest rows
+        # beyond max_rows are dropped so a burst cannot grow table forever.
+        if new_datas:
+            if self.max_rows:
+                new_datas = new_datas[-self.max_rows:]
 
-            if setting["update"]:
-                row_cells[header] = cell
+            model.insert_rows(new_datas)
 
-        if self.data_key:
-            key: str = data.__getattribute__(self.data_key)
-            self.cells[key] = row_cells
+            if self.max_rows:
+                model.trim_rows(self.max_rows)
+
+        # The view has no proxy resorting rows by itself, so sort once for
+        # the whole batch, and only if row order may have changed.
+        if self.sorting:
+            header: QtWidgets.QHeaderView = self.horizontalHeader()
+            column: int = header.sortIndicatorSection()
+
+            if new_datas or (updated and column in model.update_columns):
+                model.sort(column, header.sortIndicatorOrder())
+
+    def process_event(self, event: Event) -> None:
+        """
+        Process new data from event and update into table.
+        """
+        self.process_events([event])
+
+    def insert_new_row(self, data: Any) -> None:
+        """
+        Insert a new row at the top of table.
+        """
+        self.monitor_model.insert_row(data)
 
     def update_old_row(self, data: Any) -> None:
         """
         Update an old row in table.
         """
-        key: str = data.__getattribute__(self.data_key)
-        row_cells = self.cells[key]
+        key: str = self.monitor_model.key_getter(data)
+        row: int = self.monitor_model.find_row(key)
 
-        for header, cell in row_cells.items():
-            content = data.__getattribute__(header)
-            cell.set_content(content, data)
+        # Data of unknown key is shown as a new row
+        if row < 0:
+            self.insert_new_row(data)
+            return
+
+        self.monitor_model.update_row(row, data)
+
+    def on_double_clicked(self, index: QtCore.QModelIndex) -> None:
+        """
+        Emit data object of the double clicked row.
+        """
+        self.data_double_clicked.emit(self.monitor_model.get_data(index.row()))
+
+    def current_data(self) -> Any:
+        """
+        Get data object of current row, None if no row selected.
+        """
+        index: QtCore.QModelIndex = self.currentIndex()
+        if not index.isValid():
+            return None
+        return self.monitor_model.get_data(index.row())
 
     def resize_columns(self) -> None:
         """
         Resize all columns according to contents.
         """
+        self.resize_timer.start()
+
+    def do_resize_columns(self) -> None:
+        """
+        Resize columns after repeated requests settled.
+        """
         self.horizontalHeader().resizeSections(QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
 
     def save_csv(self) -> None:
@@ -364,24 +872,42 @@ class BaseMonitor(QtWidgets.QTableWidget):
         if not path:
             return
 
-        with open(path, "w") as f:
-            writer = csv.writer(f, lineterminator="\n")
+        headers: list = [d["display"] for d in self.headers.values()]
 
-            headers: list = [d["display"] for d in self.headers.values()]
-            writer.writerow(headers)
+        # Rows are copied here in UI thread, since update_row changes the
+        # cached text lists in place while the file is being written.
+        # Only ask the view about each row when some rows are hidden,
+        # e.g. finished orders in ActiveOrderMonitor.
+        texts: list[list[str]] = self.monitor_model.texts
 
-            for row in range(self.rowCount()):
-                if self.isRowHidden(row):
-                    continue
+        if self.verticalHeader().hiddenSectionCount():
+            rows: list[tuple[str, ...]] = [
+                tuple(row_texts) for row, row_texts in enumerate(texts)
+                if not self.isRowHidden(row)
+            ]
+        else:
+            rows = [tuple(row_texts) for row_texts in texts]
 
-                row_data: list = []
-                for column in range(self.columnCount()):
-                    item: QtWidgets.QTableWidgetItem | None = self.item(row, column)
-                    if item:
-                        row_data.append(str(item.text()))
-                    else:
-                        row_data.append("")
-                writer.writerow(row_data)
+        thread: Thread = Thread(target=self.write_csv, args=(path, headers, rows))
+        thread.start()
+
+    def write_csv(self, path: str, headers: list, rows: list[tuple[str, ...]]) -> None:
+        """
+        Write table data into csv file, run in a background thread.
+        """
+        import csv
+
+        try:
+            # Large buffer to cut down write syscalls.
+            with open(path, "w", buffering=1 << 20) as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(headers)
+                writer.writerows(rows)
+        except OSError as e:
+            self.main_engine.write_log(_("数据保存失败：{}").format(e))
+            return
+
+        self.main_engine.write_log(_("数据已保存至{}").format(path))
 
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent) -> None:
         """
@@ -439,6 +965,7 @@ class LogMonitor(BaseMonitor):
     event_type: str = EVENT_LOG
     data_key: str = ""
     sorting: bool = False
+    max_rows: int = 5000
 
     headers: dict = {
         "time": {"display": _("时间"), "cell": TimeCell, "update": False},
@@ -502,13 +1029,12 @@ class OrderMonitor(BaseMonitor):
         super().init_ui()
 
         self.setToolTip(_("双击单元格撤单"))
-        self.itemDoubleClicked.connect(self.cancel_order)
+        self.data_double_clicked.connect(self.cancel_order)
 
-    def cancel_order(self, cell: BaseCell) -> None:
+    def cancel_order(self, order: OrderData) -> None:
         """
         Cancel order if cell double clicked.
         """
-        order: OrderData = cell.get_data()
         req: CancelRequest = order.create_cancel_request()
         self.main_engine.cancel_order(req, order.gateway_name)
 
@@ -585,13 +1111,12 @@ class QuoteMonitor(BaseMonitor):
         super().init_ui()
 
         self.setToolTip(_("双击单元格撤销报价"))
-        self.itemDoubleClicked.connect(self.cancel_quote)
+        self.data_double_clicked.connect(self.cancel_quote)
 
-    def cancel_quote(self, cell: BaseCell) -> None:
+    def cancel_quote(self, quote: QuoteData) -> None:
         """
         Cancel quote if cell double clicked.
         """
-        quote: QuoteData = cell.get_data()
         req: CancelRequest = quote.create_cancel_request()
         self.main_engine.cancel_quote(req, quote.gateway_name)
 
@@ -705,6 +1230,18 @@ class TradingWidget(QtWidgets.QWidget):
 
         self.vt_symbol: str = ""
         self.price_digits: int = 0
+        self.price_format: Callable[[float], str] = get_price_format(0)
+        self.volume_format: Callable[[float], str] = format_volume
+        self.return_format: Callable[[float], str] = "{:.2f}%".format
+
+        # Text last written into each depth label
+        self.label_texts: dict[QtWidgets.QLabel, str] = {}
+
+        # Latest tick waiting to be painted
+        self.pending_tick: TickData | None = None
+
+        # vt_symbol: (contract name, gateway name, gateway combo index, price digits)
+        self.contract_cache: dict[str, tuple[str, str, int, int]] = {}
 
         self.init_ui()
         self.register_event()
@@ -750,6 +1287,13 @@ class TradingWidget(QtWidgets.QWidget):
         self.price_check: QtWidgets.QCheckBox = QtWidgets.QCheckBox()
         self.price_check.setToolTip(_("设置价格随行情更新"))
 
+        # Item text to index of each combo, instead of findText scans
+        self.exchange_index: dict[str, int] = self.index_combo(self.exchange_combo)
+        self.direction_index: dict[str, int] = self.index_combo(self.direction_combo)
+        self.offset_index: dict[str, int] = self.index_combo(self.offset_combo)
+        self.order_type_index: dict[str, int] = self.index_combo(self.order_type_combo)
+        self.gateway_index: dict[str, int] = self.index_combo(self.gateway_combo)
+
         send_button: QtWidgets.QPushButton = QtWidgets.QPushButton(_("委托"))
         send_button.clicked.connect(self.send_order)
 
@@ -833,12 +1377,41 @@ class TradingWidget(QtWidgets.QWidget):
         form.addRow(self.bp4_label, self.bv4_label)
         form.addRow(self.bp5_label, self.bv5_label)
 
+        # Price/volume labels of depth level 2 to 5, and getters reading
+        # the matching tick fields into one tuple
+        price_names: list[str] = []
+        volume_names: list[str] = []
+        self.depth_price_labels: list[QtWidgets.QLabel] = []
+        self.depth_volume_labels: list[QtWidgets.QLabel] = []
+
+        for n in range(2, 6):
+            for side, prefix in (("bid", "b"), ("ask", "a")):
+                price_names.append(f"{side}_price_{n}")
+                volume_names.append(f"{side}_volume_{n}")
+                self.depth_price_labels.append(getattr(self, f"{prefix}p{n}_label"))
+                self.depth_volume_labels.append(getattr(self, f"{prefix}v{n}_label"))
+
+        self.depth_price_getter: Callable[[TickData], tuple] = attrgetter(*price_names)
+        self.depth_volume_getter: Callable[[TickData], tuple] = attrgetter(*volume_names)
+
+        self.depth_labels: list[QtWidgets.QLabel] = [
+            self.lp_label, self.return_label,
+            self.bp1_label, self.bv1_label, self.ap1_label, self.av1_label,
+            *self.depth_price_labels, *self.depth_volume_labels
+        ]
+
         # Overall layout
         vbox: QtWidgets.QVBoxLayout = QtWidgets.QVBoxLayout()
         vbox.addLayout(grid)
         vbox.addLayout(form)
         self.setLayout(vbox)
 
+    def index_combo(self, combo: QtWidgets.QComboBox) -> dict[str, int]:
+        """
+        Map item text to index of combo box.
+        """
+        return {combo.itemText(i): i for i in range(combo.count())}
+
     def create_label(
         self,
         color: str = "",
@@ -853,10 +1426,32 @@ class TradingWidget(QtWidgets.QWidget):
         label.setAlignment(Qt.AlignmentFlag(alignment))
         return label
 
+    def set_label_texts(self, texts: list[tuple[QtWidgets.QLabel, str]]) -> None:
+        """
+        Set text of labels, skipped if same as last written.
+        """
+        label_texts: dict[QtWidgets.QLabel, str] = self.label_texts
+        for label, text in texts:
+            if label_texts.get(label, None) != text:
+                label.setText(text)
+                label_texts[label] = text
+
     def register_event(self) -> None:
         """"""
         self.signal_tick.connect(self.process_tick_event)
-        self.event_engine.register(EVENT_TICK, self.signal_tick.emit)
+        self.event_engine.register(EVENT_CONTRACT, self.process_contract_event)
+
+        # Labels are repainted at most once per interval with the latest tick
+        self.tick_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self.tick_timer.setSingleShot(True)
+        self.tick_timer.setInterval(40)
+        self.tick_timer.timeout.connect(self.flush_tick)
+
+    def process_contract_event(self, event: Event) -> None:
+        """
+        Invalidate cached contract lookups.
+        """
+        self.contract_cache.clear()
 
     def process_tick_event(self, event: Event) -> None:
         """"""
@@ -864,41 +1459,46 @@ class TradingWidget(QtWidgets.QWidget):
         if tick.vt_symbol != self.vt_symbol:
             return
 
-        price_digits: int = self.price_digits
+        self.pending_tick = tick
+        if not self.tick_timer.isActive():
+            self.tick_timer.start()
 
-        self.lp_label.setText(f"{tick.last_price:.{price_digits}f}")
-        self.bp1_label.setText(f"{tick.bid_price_1:.{price_digits}f}")
-        self.bv1_label.setText(str(tick.bid_volume_1))
-        self.ap1_label.setText(f"{tick.ask_price_1:.{price_digits}f}")
-        self.av1_label.setText(str(tick.ask_volume_1))
+    def flush_tick(self) -> None:
+        """
+        Update labels with the latest pending tick.
+        """
+        tick: TickData | None = self.pending_tick
+        if not tick:
+            return
+        self.pending_tick = None
+
+        self.update_tick(tick)
+
+    def update_tick(self, tick: TickData) -> None:
+        """"""
+        price_format: Callable[[float], str] = self.price_format
+        volume_format: Callable[[float], str] = self.volume_format
+
+        texts: list[tuple[QtWidgets.QLabel, str]] = [
+            (self.lp_label, price_format(tick.last_price)),
+            (self.bp1_label, price_format(tick.bid_price_1)),
+            (self.bv1_label, volume_format(tick.bid_volume_1)),
+            (self.ap1_label, price_format(tick.ask_price_1)),
+            (self.av1_label, volume_format(tick.ask_volume_1)),
+        ]
 
         if tick.pre_close:
             r: float = (tick.last_price / tick.pre_close - 1) * 100
-            self.return_label.setText(f"{r:.2f}%")
+            texts.append((self.return_label, self.return_format(r)))
 
         if tick.bid_price_2:
-            self.bp2_label.setText(f"{tick.bid_price_2:.{price_digits}f}")
-            self.bv2_label.setText(str(tick.bid_volume_2))
-            self.ap2_label.setText(f"{tick.ask_price_2:.{price_digits}f}")
-            self.av2_label.setText(str(tick.ask_volume_2))
-
-            self.bp3_label.setText(f"{tick.bid_price_3:.{price_digits}f}")
-            self.bv3_label.setText(str(tick.bid_volume_3))
-            self.ap3_label.setText(f"{tick.ask_price_3:.{price_digits}f}")
-            self.av3_label.setText(str(tick.ask_volume_3))
-
-            self.bp4_label.setText(f"{tick.bid_price_4:.{price_digits}f}")
-            self.bv4_label.setText(str(tick.bid_volume_4))
-            self.ap4_label.setText(f"{tick.ask_price_4:.{price_digits}f}")
-            self.av4_label.setText(str(tick.ask_volume_4))
-
-            self.bp5_label.setText(f"{tick.bid_price_5:.{price_digits}f}")
-            self.bv5_label.setText(str(tick.bid_volume_5))
-            self.ap5_label.setText(f"{tick.ask_price_5:.{price_digits}f}")
-            self.av5_label.setText(str(tick.ask_volume_5))
+            texts.extend(zip(self.depth_price_labels, map(price_format, self.depth_price_getter(tick)), strict=True))
+            texts.extend(zip(self.depth_volume_labels, map(volume_format, self.depth_volume_getter(tick)), strict=True))
+
+        self.set_label_texts(texts)
 
         if self.price_check.isChecked():
-            self.price_line.setText(f"{tick.last_price:.{price_digits}f}")
+            self.price_line.setText(price_format(tick.last_price))
 
     def set_vt_symbol(self) -> None:
         """
@@ -914,24 +1514,43 @@ class TradingWidget(QtWidgets.QWidget):
 
         if vt_symbol == self.vt_symbol:
             return
-        self.vt_symbol = vt_symbol
+
+        # Gateways also publish ticks under EVENT_TICK + vt_symbol, listen to
+        # current symbol only instead of handling the whole tick stream.
+        if self.vt_symbol:
+            self.event_engine.unregister(EVENT_TICK + self.vt_symbol, self.signal_tick.emit)
+        self.event_engine.register(EVENT_TICK + vt_symbol, self.signal_tick.emit)
+
+        self.vt_symbol = intern(vt_symbol)
 
         # Update name line widget and clear all labels
-        contract: ContractData | None = self.main_engine.get_contract(vt_symbol)
-        if not contract:
-            self.name_line.setText("")
-            gateway_name: str = self.gateway_combo.currentText()
+        cached: tuple[str, str, int, int] | None = self.contract_cache.get(vt_symbol, None)
+        if cached:
+            name, gateway_name, ix, self.price_digits = cached
+            self.name_line.setText(name)
+            self.gateway_combo.setCurrentIndex(ix)
         else:
-            self.name_line.setText(contract.name)
-            gateway_name = contract.gateway_name
+            contract: ContractData | None = self.main_engine.get_contract(vt_symbol)
+            if not contract:
+                self.name_line.setText("")
+                gateway_name = self.gateway_combo.currentText()
+            else:
+                self.name_line.setText(contract.name)
+                gateway_name = contract.gateway_name
 
-            # Update gateway combo box.
-            ix: int = self.gateway_combo.findText(gateway_name)
-            self.gateway_combo.setCurrentIndex(ix)
+                # Update gateway combo box.
+                ix = self.gateway_index.get(gateway_name, -1)
+                self.gateway_combo.setCurrentIndex(ix)
 
-            # Update price digits
-            self.price_digits = get_digits(contract.pricetick)
+                # Update price digits
+                self.price_digits = get_pricetick_digits(contract.pricetick)
 
+                self.contract_cache[vt_symbol] = (contract.name, gateway_name, ix, self.price_digits)
+
+        # Format method bound once, instead of parsing precision in each tick
+        self.price_format = get_price_format(self.price_digits)
+
+        self.pending_tick = None
         self.clear_label_text()
         self.volume_line.setText("")
         self.price_line.setText("")
@@ -947,32 +1566,7 @@ class TradingWidget(QtWidgets.QWidget):
         """
         Clear text on all labels.
         """
-        self.lp_label.setText("")
-        self.return_label.setText("")
-
-        self.bv1_label.setText("")
-        self.bv2_label.setText("")
-        self.bv3_label.setText("")
-        self.bv4_label.setText("")
-        self.bv5_label.setText("")
-
-        self.av1_label.setText("")
-        self.av2_label.setText("")
-        self.av3_label.setText("")
-        self.av4_label.setText("")
-        self.av5_label.setText("")
-
-        self.bp1_label.setText("")
-        self.bp2_label.setText("")
-        self.bp3_label.setText("")
-        self.bp4_label.setText("")
-        self.bp5_label.setText("")
-
-        self.ap1_label.setText("")
-        self.ap2_label.setText("")
-        self.ap3_label.setText("")
-        self.ap4_label.setText("")
-        self.ap5_label.setText("")
+        self.set_label_texts([(label, "") for label in self.depth_labels])
 
     def send_order(self) -> None:
         """
@@ -1019,13 +1613,11 @@ class TradingWidget(QtWidgets.QWidget):
             req: CancelRequest = order.create_cancel_request()
             self.main_engine.cancel_order(req, order.gateway_name)
 
-    def update_with_cell(self, cell: BaseCell) -> None:
+    def update_with_data(self, data: Any) -> None:
         """"""
-        data = cell.get_data()
-
         self.symbol_line.setText(data.symbol)
         self.exchange_combo.setCurrentIndex(
-            self.exchange_combo.findText(data.exchange.value)
+            self.exchange_index.get(data.exchange.value, -1)
         )
 
         self.set_vt_symbol()
@@ -1042,10 +1634,10 @@ class TradingWidget(QtWidgets.QWidget):
                     direction = Direction.LONG
 
             self.direction_combo.setCurrentIndex(
-                self.direction_combo.findText(direction.value)
+                self.direction_index.get(direction.value, -1)
             )
             self.offset_combo.setCurrentIndex(
-                self.offset_combo.findText(Offset.CLOSE.value)
+                self.offset_index.get(Offset.CLOSE.value, -1)
             )
             self.volume_line.setText(str(abs(data.volume)))
 
@@ -1055,20 +1647,34 @@ class ActiveOrderMonitor(OrderMonitor):
     Monitor which shows active order only.
     """
 
-    def process_event(self, event: Event) -> None:
+    def process_events(self, events: list[Event]) -> None:
         """
         Hides the row if order is not active.
         """
-        super().process_event(event)
+        super().process_events(events)
 
-        order: OrderData = event.data
-        row_cells: dict = self.cells[order.vt_orderid]
-        row: int = self.row(row_cells["volume"])
+        # Row visibility after this batch, keyed by row
+        visible: dict[int, bool] = {}
+        for event in events:
+            order: OrderData = event.data
+            row: int = self.monitor_model.find_row(order.vt_orderid)
+            visible[row] = order.is_active()
 
-        if order.is_active():
-            self.showRow(row)
-        else:
-            self.hideRow(row)
+        changed: list[tuple[int, bool]] = [
+            (row, show) for row, show in visible.items() if self.isRowHidden(row) == show
+        ]
+        if not changed:
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            for row, show in changed:
+                if show:
+                    self.showRow(row)
+                else:
+                    self.hideRow(row)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class StockTradingWidget(QtWidgets.QWidget):
@@ -1092,6 +1698,10 @@ class StockTradingWidget(QtWidgets.QWidget):
         self.available_balance: float = 0
         self.position_volume: int = 0
         
+        # Set by main window which keeps this widget in its widgets dict
+        self._widget_name: str = ""
+        self._main_window_ref: Callable[[], Any] | None = None
+
         self.init_ui()
         self.register_event()
     
@@ -1119,18 +1729,15 @@ class StockTradingWidget(QtWidgets.QWidget):
         """Initialize trading tab interface."""
         # Symbol input
         self.symbol_edit = QtWidgets.QLineEdit()
-        self.symbol_edit.setGeometry(50, 10, 130, 21)
         self.symbol_edit.setText("128131    崇达转2")
         self.symbol_edit.returnPressed.connect(self.on_symbol_changed)
         
         # Order type combo
         self.type_combo = QtWidgets.QComboBox()
-        self.type_combo.setGeometry(50, 40, 130, 24)
         self.type_combo.addItems(["限价", "其他"])
         
         # Price input
         self.price_spinbox = QtWidgets.QDoubleSpinBox()
-        self.price_spinbox.setGeometry(50, 70, 130, 23)
         self.price_spinbox.setDecimals(3)
         self.price_spinbox.setMaximum(9999.999)
         self.price_spinbox.setSingleStep(0.001)
@@ -1138,116 +1745,130 @@ class StockTradingWidget(QtWidgets.QWidget):
         
         # Volume combo
         self.volume_combo = QtWidgets.QComboBox()
-        self.volume_combo.setGeometry(50, 110, 91, 24)
         self.volume_combo.setEditable(True)
         
         # Position fraction radio buttons with better spacing
         self.radio_half = QtWidgets.QRadioButton("1/2")
-        self.radio_half.setGeometry(10, 150, 50, 22)  # 增加宽度和高度
         self.radio_half.setStyleSheet("font-size: 12px;")
         self.radio_half.clicked.connect(lambda: self.on_fraction_selected(0.5))
         
         self.radio_third = QtWidgets.QRadioButton("1/3")
-        self.radio_third.setGeometry(70, 150, 50, 22)
         self.radio_third.setStyleSheet("font-size: 12px;")
         self.radio_third.clicked.connect(lambda: self.on_fraction_selected(1.0/3))
         
         self.radio_quarter = QtWidgets.QRadioButton("1/4")
-        self.radio_quarter.setGeometry(130, 150, 50, 22)
         self.radio_quarter.setStyleSheet("font-size: 12px;")
         self.radio_quarter.clicked.connect(lambda: self.on_fraction_selected(0.25))
         
         self.radio_fifth = QtWidgets.QRadioButton("1/5")
-        self.radio_fifth.setGeometry(190, 150, 50, 22)
         self.radio_fifth.setStyleSheet("font-size: 12px;")
         self.radio_fifth.clicked.connect(lambda: self.on_fraction_selected(0.2))
         
         # High Touch order checkbox with better text
         self.high_touch_checkbox = QtWidgets.QCheckBox("High Touch单")  # 简化文字
-        self.high_touch_checkbox.setGeometry(10, 180, 120, 22)  # 调整尺寸
         self.high_touch_checkbox.setStyleSheet("font-size: 12px;")
         
         # Auto cancel checkbox and spinbox
         self.auto_cancel_checkbox = QtWidgets.QCheckBox("秒后自动撤单")
-        self.auto_cancel_checkbox.setGeometry(80, 210, 140, 22)  # 增加宽度
         self.auto_cancel_checkbox.setStyleSheet("font-size: 12px;")
         
         self.cancel_spinbox = QtWidgets.QSpinBox()
-        self.cancel_spinbox.setGeometry(10, 210, 61, 23)
         self.cancel_spinbox.setValue(3)
         
         # Trading buttons - first row: 买入 和 卖出
         self.buy_button = QtWidgets.QPushButton("买入")
-        self.buy_button.setGeometry(10, 250, 120, 35)  # 增加宽度以更好地利用空间
         self.buy_button.setStyleSheet("QPushButton { background-color: rgb(170, 0, 0); color: white; font-size: 12px; }")
         self.buy_button.clicked.connect(self.on_buy_clicked)
         
         self.sell_button = QtWidgets.QPushButton("卖出")
-        self.sell_button.setGeometry(140, 250, 120, 35)  # 增加宽度并调整位置
         self.sell_button.setStyleSheet("QPushButton { background-color: rgb(0, 85, 0); color: white; font-size: 12px; }")
         self.sell_button.clicked.connect(self.on_sell_clicked)
         
         # Trading buttons - second row: 卖空 和 平空
         self.sell_short_button = QtWidgets.QPushButton("卖空")
-        self.sell_short_button.setGeometry(10, 295, 120, 35)  # 放在买入按钮下方
         self.sell_short_button.setStyleSheet("QPushButton { background-color: rgb(0, 85, 0); color: white; font-size: 12px; }")
         self.sell_short_button.clicked.connect(self.on_sell_short_clicked)
         
         self.cover_button = QtWidgets.QPushButton("平空")
-        self.cover_button.setGeometry(140, 295, 120, 35)  # 放在卖出按钮下方
         self.cover_button.setStyleSheet("QPushButton { background-color: rgb(170, 0, 0); color: white; font-size: 12px; }")
         self.cover_button.clicked.connect(self.on_cover_clicked)
         
         # Labels with optimized size and font
         label_symbol = QtWidgets.QLabel("代码")
-        label_symbol.setGeometry(10, 10, 40, 18)  # 增加宽度和高度
         label_symbol.setStyleSheet("font-size: 12px;")  # 恢复到12px
         
         label_type = QtWidgets.QLabel("类型")
-        label_type.setGeometry(10, 40, 40, 18)
         label_type.setStyleSheet("font-size: 12px;")
         
         label_price = QtWidgets.QLabel("价格")
-        label_price.setGeometry(10, 70, 40, 18)
         label_price.setStyleSheet("font-size: 12px;")
         
         label_volume = QtWidgets.QLabel("数量")
-        label_volume.setGeometry(10, 110, 40, 18)
         label_volume.setStyleSheet("color: rgb(85, 170, 127); font-size: 12px;")
         
         label_shares = QtWidgets.QLabel("股")
-        label_shares.setGeometry(150, 110, 25, 18)
         label_shares.setStyleSheet("font-size: 12px;")
         
         label_max_sell = QtWidgets.QLabel("最大可卖:")
-        label_max_sell.setGeometry(200, 10, 80, 18)  # 调整位置避免重叠
         label_max_sell.setStyleSheet("font-size: 12px;")
         
         label_max_buy = QtWidgets.QLabel("最大可买(参考):")
-        label_max_buy.setGeometry(200, 50, 120, 18)  # 放在最大可卖下面
         label_max_buy.setStyleSheet("font-size: 12px;")
         
         # Position and balance display labels - 放在对应提示文字下面
         self.max_sell_label = QtWidgets.QLabel("6,020")
-        self.max_sell_label.setGeometry(200, 30, 80, 18)  # 放在"最大可卖"下面
         self.max_sell_label.setStyleSheet("color: rgb(85, 170, 127); font-size: 12px; font-weight: bold;")
         
         self.max_buy_label = QtWidgets.QLabel("170,430")
-        self.max_buy_label.setGeometry(200, 70, 120, 18)  # 放在"最大可买(参考)"下面
         self.max_buy_label.setStyleSheet("color: rgb(85, 170, 127); font-size: 12px; font-weight: bold;")
         
-        # Add all widgets to trading tab
-        widgets = [
-            self.symbol_edit, self.type_combo, self.price_spinbox, self.volume_combo,
-            self.radio_half, self.radio_third, self.radio_quarter, self.radio_fifth,
-            self.high_touch_checkbox, self.auto_cancel_checkbox, self.cancel_spinbox,
-            self.buy_button, self.sell_button, self.sell_short_button, self.cover_button,
-            label_symbol, label_type, label_price, label_volume, label_shares,
-            label_max_sell, label_max_buy, self.max_sell_label, self.max_buy_label
-        ]
-        
-        for widget in widgets:
-            widget.setParent(self.trading_tab)
+        # Positions are computed by layouts instead of fixed geometries
+        volume_hbox = QtWidgets.QHBoxLayout()
+        volume_hbox.addWidget(self.volume_combo)
+        volume_hbox.addWidget(label_shares)
+
+        grid = QtWidgets.QGridLayout()
+        grid.addWidget(label_symbol, 0, 0)
+        grid.addWidget(self.symbol_edit, 0, 1)
+        grid.addWidget(label_max_sell, 0, 2)
+        grid.addWidget(label_type, 1, 0)
+        grid.addWidget(self.type_combo, 1, 1)
+        grid.addWidget(self.max_sell_label, 1, 2)
+        grid.addWidget(label_price, 2, 0)
+        grid.addWidget(self.price_spinbox, 2, 1)
+        grid.addWidget(label_max_buy, 2, 2)
+        grid.addWidget(label_volume, 3, 0)
+        grid.addLayout(volume_hbox, 3, 1)
+        grid.addWidget(self.max_buy_label, 3, 2)
+
+        radio_hbox = QtWidgets.QHBoxLayout()
+        radio_hbox.addWidget(self.radio_half)
+        radio_hbox.addWidget(self.radio_third)
+        radio_hbox.addWidget(self.radio_quarter)
+        radio_hbox.addWidget(self.radio_fifth)
+        radio_hbox.addStretch()
+
+        cancel_hbox = QtWidgets.QHBoxLayout()
+        cancel_hbox.addWidget(self.cancel_spinbox)
+        cancel_hbox.addWidget(self.auto_cancel_checkbox)
+        cancel_hbox.addStretch()
+        
+        button_grid = QtWidgets.QGridLayout()
+        button_grid.addWidget(self.buy_button, 0, 0)
+        button_grid.addWidget(self.sell_button, 0, 1)
+        button_grid.addWidget(self.sell_short_button, 1, 0)
+        button_grid.addWidget(self.cover_button, 1, 1)
+
+        for button in (self.buy_button, self.sell_button, self.sell_short_button, self.cover_button):
+            button.setMinimumHeight(35)
+
+        vbox = QtWidgets.QVBoxLayout(self.trading_tab)
+        vbox.addLayout(grid)
+        vbox.addLayout(radio_hbox)
+        vbox.addWidget(self.high_touch_checkbox)
+        vbox.addLayout(cancel_hbox)
+        vbox.addLayout(button_grid)
+        vbox.addStretch()
     
     def register_event(self) -> None:
         """Register event handlers."""
@@ -1255,10 +1876,26 @@ class StockTradingWidget(QtWidgets.QWidget):
         self.signal_position.connect(self.process_position_event)
         self.signal_account.connect(self.process_account_event)
         
-        self.event_engine.register(EVENT_TICK, self.signal_tick.emit)
+        # Tick events are registered per symbol in set_tick_symbol
         self.event_engine.register(EVENT_POSITION, self.signal_position.emit)
         self.event_engine.register(EVENT_ACCOUNT, self.signal_account.emit)
     
+    def set_tick_symbol(self, symbol: str, exchange: Exchange) -> None:
+        """Listen to and subscribe tick data of symbol, listening is kept if unchanged."""
+        vt_symbol: str = f"{symbol}.{exchange.value}"
+        if vt_symbol != self.vt_symbol:
+            if self.vt_symbol:
+                self.event_engine.unregister(EVENT_TICK + self.vt_symbol, self.signal_tick.emit)
+            self.event_engine.register(EVENT_TICK + vt_symbol, self.signal_tick.emit)
+
+            self.vt_symbol = intern(vt_symbol)
+
+        # Subscribe to tick data every time, earlier request may have found no connected gateway
+        req = SubscribeRequest(symbol=symbol, exchange=exchange)
+        gateway_names = self.main_engine.get_all_gateway_names()
+        if gateway_names:
+            self.main_engine.subscribe(req, gateway_names[0])
+
     def process_tick_event(self, event: Event) -> None:
         """Process tick data event."""
         tick: TickData = event.data
@@ -1292,13 +1929,7 @@ class StockTradingWidget(QtWidgets.QWidget):
         
         # Extract symbol code (first part before space)
         symbol = symbol_text.split()[0]
-        self.vt_symbol = f"{symbol}.SSE"  # Assume SSE exchange for stocks
-        
-        # Subscribe to tick data
-        req = SubscribeRequest(symbol=symbol, exchange=Exchange.SSE)
-        gateway_names = self.main_engine.get_all_gateway_names()
-        if gateway_names:
-            self.main_engine.subscribe(req, gateway_names[0])
+        self.set_tick_symbol(symbol, Exchange.SSE)  # Assume SSE exchange for stocks
     
     def on_fraction_selected(self, fraction: float) -> None:
         """Handle position fraction selection."""
@@ -1375,10 +2006,8 @@ class StockTradingWidget(QtWidgets.QWidget):
         """Handle cover button click."""
         self.send_order(Direction.LONG)
     
-    def update_with_cell(self, cell: BaseCell) -> None:
-        """Update widget with data from a cell (e.g., from tick or position monitor)."""
-        data = cell.get_data()
-        
+    def update_with_data(self, data: Any) -> None:
+        """Update widget with data object (e.g., from tick or position monitor)."""
         if hasattr(data, 'symbol'):
             # Update symbol
             if hasattr(data, 'name'):
@@ -1387,18 +2016,8 @@ class StockTradingWidget(QtWidgets.QWidget):
                 symbol_text = data.symbol
             self.symbol_edit.setText(symbol_text)
             
-            # Set vt_symbol for monitoring
-            if hasattr(data, 'exchange'):
-                self.vt_symbol = f"{data.symbol}.{data.exchange.value}"
-            else:
-                self.vt_symbol = f"{data.symbol}.SSE"
-            
-            # Subscribe to tick data
-            req = SubscribeRequest(symbol=data.symbol, 
-                                 exchange=getattr(data, 'exchange', Exchange.SSE))
-            gateway_names = self.main_engine.get_all_gateway_names()
-            if gateway_names:
-                self.main_engine.subscribe(req, gateway_names[0])
+            # Set vt_symbol for monitoring and subscribe to tick data
+            self.set_tick_symbol(data.symbol, getattr(data, 'exchange', Exchange.SSE))
         
         # If it's position data, update position-related fields
         if isinstance(data, PositionData):
@@ -1409,19 +2028,13 @@ class StockTradingWidget(QtWidgets.QWidget):
         if isinstance(data, TickData):
             self.price_spinbox.setValue(data.last_price)
 
-    def closeEvent(self, event) -> None:
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """Handle window close event."""
-        # Find and remove this widget from main window's widgets dict
-        if hasattr(self, '_widget_name'):
-            # Get the main window instance (parent widgets until we find MainWindow)
-            parent = self.parent()
-            while parent:
-                if hasattr(parent, 'widgets') and hasattr(parent, 'main_engine'):
-                    # Found the main window
-                    if self._widget_name in parent.widgets:
-                        del parent.widgets[self._widget_name]
-                    break
-                parent = parent.parent()
+        # Remove this widget from main window's widgets dict
+        if self._main_window_ref:
+            main_window: Any = self._main_window_ref()
+            if main_window is not None:
+                main_window.widgets.pop(self._widget_name, None)
         
         # Call parent closeEvent
         super().closeEvent(event)
@@ -1448,13 +2061,25 @@ class ContractManager(QtWidgets.QWidget):
         "gateway_name": _("交易接口"),
     }
 
+    # Cell type of each column which is not shown as plain text
+    cells: dict[str, type[BaseCell]] = {
+        "exchange": EnumCell,
+        "product": EnumCell,
+        "option_expiry": DateCell,
+        "option_type": EnumCell,
+    }
+
     def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
         super().__init__()
 
         self.main_engine: MainEngine = main_engine
         self.event_engine: EventEngine = event_engine
 
+        # All contracts with lowercase vt_symbol, cleared on new contract
+        self.contracts_cache: list[tuple[ContractData, str]] | None = None
+
         self.init_ui()
+        self.register_event()
 
     def init_ui(self) -> None:
         """"""
@@ -1489,40 +2114,65 @@ class ContractManager(QtWidgets.QWidget):
 
         self.setLayout(vbox)
 
+    def register_event(self) -> None:
+        """"""
+        self.event_engine.register(EVENT_CONTRACT, self.process_contract_event)
+
+    def process_contract_event(self, event: Event) -> None:
+        """
+        Invalidate cached contract list.
+        """
+        self.contracts_cache = None
+
     def show_contracts(self) -> None:
         """
         Show contracts by symbol
         """
-        flt: str = str(self.filter_line.text())
+        flt: str = str(self.filter_line.text()).lower()
+
+        contracts_cache: list[tuple[ContractData, str]] | None = self.contracts_cache
+        if contracts_cache is None:
+            contracts_cache = [
+                (contract, contract.vt_symbol.lower())
+                for contract in self.main_engine.get_all_contracts()
+            ]
+            self.contracts_cache = contracts_cache
 
-        all_contracts: list[ContractData] = self.main_engine.get_all_contracts()
         if flt:
             contracts: list[ContractData] = [
-                contract for contract in all_contracts if flt in contract.vt_symbol
+                contract for contract, vt_symbol in contracts_cache if flt in vt_symbol
             ]
         else:
-            contracts = all_contracts
+            contracts = [contract for contract, __ in contracts_cache]
 
-        self.contract_table.clearContents()
-        self.contract_table.setRowCount(len(contracts))
+        # Cell type and value getter resolved once per column
+        columns: list[tuple[int, type[BaseCell], attrgetter]] = [
+            (column, self.cells.get(name, BaseCell), attrgetter(name))
+            for column, name in enumerate(self.headers.keys())
+        ]
 
-        for row, contract in enumerate(contracts):
-            for column, name in enumerate(self.headers.keys()):
-                value: Any = getattr(contract, name)
+        table: QtWidgets.QTableWidget = self.contract_table
+        set_item: Callable[[int, int, QtWidgets.QTableWidgetItem], None] = table.setItem
 
-                if value in {None, 0}:
-                    value = ""
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.clearContents()
+            table.setRowCount(len(contracts))
 
-                cell: BaseCell
-                if isinstance(value, Enum):
-                    cell = EnumCell(value, contract)
-                elif isinstance(value, datetime):
-                    cell = DateCell(value, contract)
-                else:
-                    cell = BaseCell(value, contract)
-                self.contract_table.setItem(row, column, cell)
+            for row, contract in enumerate(contracts):
+                for column, cell_type, getter in columns:
+                    value: Any = getter(contract)
+
+                    if value in {None, 0}:
+                        set_item(row, column, BaseCell("", contract))
+                    else:
+                        set_item(row, column, cell_type(value, contract))
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
-        self.contract_table.resizeColumnsToContents()
+        table.resizeColumnsToContents()
 
 
 class AboutDialog(QtWidgets.QDialog):
@@ -1543,6 +2193,9 @@ class AboutDialog(QtWidgets.QDialog):
         """"""
         self.setWindowTitle(_("关于VeighNa Trader"))
 
+        import platform
+        from importlib import metadata
+
         from ... import __version__ as vnpy_version
 
         text: str = f"""
@@ -1577,11 +2230,16 @@ class GlobalDialog(QtWidgets.QDialog):
     Start connection of a certain gateway.
     """
 
+    # Converters from line edit text, other types are called directly
+    converters: dict[type, Callable[[str], Any]] = {
+        bool: lambda text: text == "True",
+    }
+
     def __init__(self) -> None:
         """"""
         super().__init__()
 
-        self.widgets: dict[str, tuple[QtWidgets.QLineEdit, type]] = {}
+        self.widgets: dict[str, tuple[QtWidgets.QLineEdit, Callable[[str], Any]]] = {}
 
         self.init_ui()
 
@@ -1601,7 +2259,7 @@ class GlobalDialog(QtWidgets.QDialog):
             widget: QtWidgets.QLineEdit = QtWidgets.QLineEdit(str(field_value))
 
             form.addRow(f"{field_name} <{field_type.__name__}>", widget)
-            self.widgets[field_name] = (widget, field_type)
+            self.widgets[field_name] = (widget, self.converters.get(field_type, field_type))
 
         button: QtWidgets.QPushButton = QtWidgets.QPushButton(_("确定"))
         button.clicked.connect(self.update_setting)
@@ -1623,19 +2281,8 @@ class GlobalDialog(QtWidgets.QDialog):
         Get setting value from line edits and update global setting file.
         """
         settings: dict = {}
-        for field_name, tp in self.widgets.items():
-            widget, field_type = tp
-            value_text: str = widget.text()
-
-            if field_type is bool:
-                if value_text == "True":
-                    field_value: bool = True
-                else:
-                    field_value = False
-            else:
-                field_value = field_type(value_text)
-
-            settings[field_name] = field_value
+        for field_name, (widget, converter) in self.widgets.items():
+            settings[field_name] = converter(widget.text())
 
         QtWidgets.QMessageBox.information(
             self,
@@ -1648,6 +2295,136 @@ class GlobalDialog(QtWidgets.QDialog):
         self.accept()
 
 
+# Sample trades shown in Level2Widget info table before any tick arrives
+SAMPLE_TRADES: tuple[tuple[str, str], ...] = (
+    ("4.09", "1,200"),
+    ("4.08", "800"),
+    ("4.09", "1,500"),
+    ("4.08", "900"),
+    ("4.07", "1,100"),
+    ("4.08", "700"),
+    ("4.09", "1,300"),
+    ("4.08", "600"),
+    ("4.07", "1,000"),
+    ("4.08", "850"),
+    ("4.09", "1,400"),
+    ("4.08", "950"),
+    ("4.07", "750"),
+    ("4.08", "1,250"),
+    ("4.09", "680"),
+    ("4.08", "1,020"),
+    ("4.07", "890"),
+    ("4.08", "1,150"),
+    ("4.09", "720"),
+    ("4.08", "980"),
+)
+
+# Sample trades with price and volume parsed once: price text, volume text, price, volume
+SAMPLE_TRADE_ROWS: tuple[tuple[str, str, float, int], ...] = tuple(
+    (price_str, volume_str, float(price_str), int(volume_str.replace(",", "")))
+    for price_str, volume_str in SAMPLE_TRADES
+)
+
+
+class DepthModel(QtCore.QAbstractTableModel):
+    """
+    Table model holding text, foreground and background colors of depth table cells.
+    """
+
+    def __init__(self, labels: list[str], row_count: int, parent: QtCore.QObject | None = None) -> None:
+        """"""
+        super().__init__(parent)
+
+        self.labels: list[str] = labels
+
+        self.texts: list[list[str]] = [[""] * len(labels) for __ in range(row_count)]
+        self.foregrounds: list[list[QtGui.QBrush | None]] = [[None] * len(labels) for __ in range(row_count)]
+        self.backgrounds: list[list[QtGui.QBrush | None]] = [[None] * len(labels) for __ in range(row_count)]
+
+        # Cell values of each role, so data() needs one lookup per call
+        alignments: list[list[int]] = [[ALIGN_CENTER] * len(labels)] * row_count
+        self.role_values: dict[int, list[list]] = {
+            Qt.ItemDataRole.DisplayRole: self.texts,
+            Qt.ItemDataRole.ForegroundRole: self.foregrounds,
+            Qt.ItemDataRole.BackgroundRole: self.backgrounds,
+            Qt.ItemDataRole.TextAlignmentRole: alignments,
+        }
+
+    def rowCount(self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = ROOT_INDEX) -> int:
+        """"""
+        if parent.isValid():
+            return 0
+        return len(self.texts)
+
+    def columnCount(self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = ROOT_INDEX) -> int:
+        """"""
+        if parent.isValid():
+            return 0
+        return len(self.labels)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        """"""
+        values: list[list] | None = self.role_values.get(role, None)
+        if values is None:
+            return None
+        return values[index.row()][index.column()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        """"""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.labels[section]
+        return None
+
+    def set_row(
+        self,
+        row: int,
+        texts: list[str],
+        foregrounds: list[QtGui.QBrush | None] | None = None,
+        backgrounds: list[QtGui.QBrush | None] | None = None
+    ) -> None:
+        """
+        Set texts of a row, foregrounds and backgrounds are kept if not given.
+        """
+        if foregrounds is None:
+            foregrounds = self.foregrounds[row]
+        if backgrounds is None:
+            backgrounds = self.backgrounds[row]
+
+        # Skip repaint if nothing changed
+        if (
+            texts == self.texts[row]
+            and foregrounds == self.foregrounds[row]
+            and backgrounds == self.backgrounds[row]
+        ):
+            return
+
+        self.texts[row] = texts
+        self.foregrounds[row] = foregrounds
+        self.backgrounds[row] = backgrounds
+
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.labels) - 1))
+
+    def set_text(self, row: int, column: int, text: str) -> None:
+        """
+        Set text of a single cell.
+        """
+        if self.texts[row][column] == text:
+            return
+        self.texts[row][column] = text
+
+        index: QtCore.QModelIndex = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+
 class Level2Widget(QtWidgets.QFrame):
     """
     Level-2 market data widget based on level2.ui layout.
@@ -1665,7 +2442,39 @@ class Level2Widget(QtWidgets.QFrame):
         
         self.vt_symbol: str = ""
         self.symbol_name: str = ""
+        self.pre_close: float = 4.08
         
+        # Latest tick waiting to be painted, and whether signal_tick is queued,
+        # both shared with event engine thread under tick_lock
+        self.pending_tick: TickData | None = None
+        self.tick_queued: bool = False
+        self.tick_lock: Lock = Lock()
+
+        # Depth tables are created on first show
+        self.tables_built: bool = False
+
+        # Format methods bound once for the tick path
+        self.price_format: Callable[[float], str] = "{:.2f}".format
+        self.change_format: Callable[[float], str] = "{:+.2f}%".format
+
+        # Depth fields of 5 levels read in one call
+        self.bid_price_getter: Callable[[TickData], tuple] = attrgetter(*[f"bid_price_{n}" for n in range(1, 6)])
+        self.bid_volume_getter: Callable[[TickData], tuple] = attrgetter(*[f"bid_volume_{n}" for n in range(1, 6)])
+        self.ask_price_getter: Callable[[TickData], tuple] = attrgetter(*[f"ask_price_{n}" for n in range(1, 6)])
+        self.ask_volume_getter: Callable[[TickData], tuple] = attrgetter(*[f"ask_volume_{n}" for n in range(1, 6)])
+
+        # Last price, volume and brush written to each level
+        self.bid_levels: list[tuple] = [()] * 5
+        self.ask_levels: list[tuple] = [()] * 5
+
+        # Values and colors filled into header label template
+        self.header_template: str = ""
+        self.header_values: dict[str, str] = {}
+
+        # Set by main window which keeps this widget in its widgets dict
+        self._widget_name: str = ""
+        self._main_window_ref: Callable[[], Any] | None = None
+
         self.init_ui()
         self.register_event()
     
@@ -1682,408 +2491,362 @@ class Level2Widget(QtWidgets.QFrame):
             self.setStyleSheet(app.styleSheet())
         
         self.init_top_labels()
+
+    def init_tables(self) -> None:
+        """Initialize bid/ask/info tables."""
         self.init_bid_table()
         self.init_ask_table()
         self.init_info_table()
+
+        # Children added to a visible widget are not shown automatically
+        for table in (self.bid_table, self.ask_table, self.info_table):
+            table.show()
+
+        self.tables_built = True
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        """Build tables when the widget is shown for the first time."""
+        if not self.tables_built:
+            self.init_tables()
+
+        # Paint tick received before first show or while hidden
+        if self.pending_tick:
+            self.tick_timer.start()
+
+        super().showEvent(event)
     
     def init_top_labels(self) -> None:
-        """Initialize top information labels."""
-        # 最高价
-        label_high = QtWidgets.QLabel("最高", self)
-        label_high.setGeometry(10, 0, 40, 18)
-        
-        self.label_high_price = QtWidgets.QLabel("4.11", self)
-        self.label_high_price.setGeometry(10, 20, 40, 18)
-        self.label_high_price.setStyleSheet("color: rgb(255, 0, 0);")
-        
-        # 最低价
-        label_low = QtWidgets.QLabel("最低", self)
-        label_low.setGeometry(60, 0, 40, 18)
-        
-        self.label_low_price = QtWidgets.QLabel("4.06", self)
-        self.label_low_price.setGeometry(60, 20, 40, 18)
-        self.label_low_price.setStyleSheet("color: rgb(0, 170, 0);")
-        
-        # 涨幅
-        label_change = QtWidgets.QLabel("涨幅", self)
-        label_change.setGeometry(110, 0, 50, 18)
-        
-        self.label_change_pct = QtWidgets.QLabel("0.49%", self)
-        self.label_change_pct.setGeometry(110, 20, 50, 18)
-        self.label_change_pct.setStyleSheet("color: rgb(255, 0, 0);")
-        
-        # 涨停价
-        label_limit_up = QtWidgets.QLabel("涨停", self)
-        label_limit_up.setGeometry(170, 0, 40, 18)
-        
-        self.label_limit_up_price = QtWidgets.QLabel("4.49", self)
-        self.label_limit_up_price.setGeometry(170, 20, 40, 18)
-        self.label_limit_up_price.setStyleSheet("color: rgb(255, 0, 0);")
-        
-        # 跌停价
-        label_limit_down = QtWidgets.QLabel("跌停", self)
-        label_limit_down.setGeometry(220, 0, 40, 18)
-        
-        self.label_limit_down_price = QtWidgets.QLabel("3.67", self)
-        self.label_limit_down_price.setGeometry(220, 20, 40, 18)
-        self.label_limit_down_price.setStyleSheet("color: rgb(0, 170, 0);")
-        
-        # 开盘价
-        label_open = QtWidgets.QLabel("开盘", self)
-        label_open.setGeometry(270, 0, 40, 18)
-        
-        self.label_open_price = QtWidgets.QLabel("4.07", self)
-        self.label_open_price.setGeometry(270, 20, 40, 18)
-        self.label_open_price.setStyleSheet("color: rgb(0, 170, 0);")
-        
-        # 昨收价
-        label_pre_close = QtWidgets.QLabel("昨收", self)
-        label_pre_close.setGeometry(320, 0, 40, 18)
-        
-        self.label_pre_close_price = QtWidgets.QLabel("4.08", self)
-        self.label_pre_close_price.setGeometry(320, 20, 40, 18)
-        
-        # 可买股票
-        label_buyable = QtWidgets.QLabel("可买股票", self)
-        label_buyable.setGeometry(370, 0, 80, 18)
-        label_buyable.setStyleSheet("color: rgb(255, 170, 0);")
-        
-        self.label_buyable_volume = QtWidgets.QLabel("2000", self)
-        self.label_buyable_volume.setGeometry(370, 20, 80, 18)
-        self.label_buyable_volume.setStyleSheet("color: rgb(255, 170, 0);")
+        """Initialize top information label."""
+        # Key, title, column width, title color and value color of each field
+        fields: list[tuple[str, str, int, str, str]] = [
+            ("high", "最高", 50, "", COLOR_UP.name()),
+            ("low", "最低", 50, "", COLOR_DOWN.name()),
+            ("change", "涨幅", 60, "", COLOR_UP.name()),
+            ("limit_up", "涨停", 50, "", COLOR_UP.name()),
+            ("limit_down", "跌停", 50, "", COLOR_DOWN.name()),
+            ("open", "开盘", 50, "", COLOR_DOWN.name()),
+            ("pre_close", "昨收", 50, "", ""),
+            ("buyable", "可买股票", 80, "#ffaa00", "#ffaa00"),
+        ]
+
+        # Sample values shown before any tick arrives
+        self.header_values = {
+            "high": "4.11",
+            "low": "4.06",
+            "change": "0.49%",
+            "limit_up": "4.49",
+            "limit_down": "3.67",
+            "open": "4.07",
+            "pre_close": self.price_format(self.pre_close),
+            "buyable": "2000",
+        }
+
+        # All fields are drawn by one rich text label, values and colors are filled by key
+        titles: list[str] = []
+        values: list[str] = []
+        for key, title, width, title_color, value_color in fields:
+            if title_color:
+                title = f'<font color="{title_color}">{title}</font>'
+            titles.append(f'<td width="{width}">{title}</td>')
+
+            value: str = f"{{{key}}}"
+            if value_color:
+                self.header_values[f"{key}_color"] = value_color
+                value = f'<font color="{{{key}_color}}">{value}</font>'
+            values.append(f'<td width="{width}">{value}</td>')
+
+        self.header_template = (
+            '<table cellspacing="0" cellpadding="0">'
+            f'<tr>{"".join(titles)}</tr><tr>{"".join(values)}</tr>'
+            '</table>'
+        )
+
+        self.header_label = QtWidgets.QLabel(self)
+        self.header_label.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        self.header_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop)
+        self.header_label.setGeometry(10, 0, 460, 56)
+        self.header_label.setText(self.header_template.format_map(self.header_values))
     
     def init_bid_table(self) -> None:
         """Initialize bid (buy) table."""
-        self.bid_table = QtWidgets.QTableWidget(self)
+        # Set up columns and rows (10 levels)
+        self.bid_model = DepthModel(["买价", "买量"], 10, self)
+
+        self.bid_table = QtWidgets.QTableView(self)
         self.bid_table.setGeometry(10, 60, 180, 400)  # 进一步调整位置和大小
         self.bid_table.setWordWrap(True)
         self.bid_table.setCornerButtonEnabled(True)
         
-        # Hide row numbers
-        self.bid_table.verticalHeader().setVisible(False)
-        
-        # Set up columns
-        self.bid_table.setColumnCount(2)
-        self.bid_table.setHorizontalHeaderLabels(["买价", "买量"])
-        
-        # Set up rows (10 levels)
-        self.bid_table.setRowCount(10)
+        # Hide row numbers, all rows share one fixed height for better visibility
+        vertical_header: QtWidgets.QHeaderView = self.bid_table.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(30)
         
-        # Populate with sample data and set colors based on pre_close price from label
-        try:
-            sample_pre_close = float(self.label_pre_close_price.text())
-        except (ValueError, AttributeError):
-            sample_pre_close = 4.08  # Fallback value
-        
-        for i in range(10):
-            # Buy price
-            price_value = float(f"4.{10-i:02d}")
-            price_item = QtWidgets.QTableWidgetItem(f"4.{10-i:02d}")
-            price_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            
-            # Set color based on comparison with sample pre_close
-            if price_value < sample_pre_close:
-                price_item.setForeground(QtGui.QColor(0, 170, 0))  # Green
-            elif price_value > sample_pre_close:
-                price_item.setForeground(QtGui.QColor(255, 0, 0))  # Red
-            else:
-                price_item.setForeground(QtGui.QColor(255, 255, 255))  # White
-            
-            self.bid_table.setItem(i, 0, price_item)
-            
-            # Buy volume
-            volume_item = QtWidgets.QTableWidgetItem(f"{(i+1)*100}")
-            volume_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            self.bid_table.setItem(i, 1, volume_item)
+        # Populate with sample data and set colors based on pre_close price
+        price_values: list[float] = [(410 - i) / 100 for i in range(10)]
+        price_texts: list[str] = [self.price_format(value) for value in price_values]
+        price_brushes: list[QtGui.QBrush] = get_price_brushes(price_values, self.pre_close)
+
+        for i, (price_text, price_brush) in enumerate(zip(price_texts, price_brushes, strict=True)):
+            # Buy price and volume
+            self.bid_model.set_row(i, [price_text, f"{(i+1)*100}"], [price_brush, None])
         
-        # Resize columns to fit content and set proper widths
-        self.bid_table.resizeColumnsToContents()
+        # Attach model once filled so the view lays out all rows in one pass
+        self.bid_table.setModel(self.bid_model)
+
+        # Set fixed column widths, no need to measure contents
+        self.bid_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
         self.bid_table.setColumnWidth(0, 80)  # 买价列宽度
         self.bid_table.setColumnWidth(1, 90)  # 买量列宽度
-        
-        # Set row height for better visibility
-        for row in range(10):
-            self.bid_table.setRowHeight(row, 30)
     
     def init_ask_table(self) -> None:
         """Initialize ask (sell) table."""
-        self.ask_table = QtWidgets.QTableWidget(self)
+        # Set up columns and rows (10 levels)
+        self.ask_model = DepthModel(["卖价", "卖量"], 10, self)
+
+        self.ask_table = QtWidgets.QTableView(self)
         self.ask_table.setGeometry(200, 60, 180, 400)  # 进一步调整位置和大小
         
-        # Hide row numbers
-        self.ask_table.verticalHeader().setVisible(False)
+        # Hide row numbers, all rows share one fixed height for better visibility
+        vertical_header: QtWidgets.QHeaderView = self.ask_table.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(30)
         
-        # Set up columns
-        self.ask_table.setColumnCount(2)
-        self.ask_table.setHorizontalHeaderLabels(["卖价", "卖量"])
-        
-        # Set up rows (10 levels)
-        self.ask_table.setRowCount(10)
-        
-        # Populate with sample data and set colors based on pre_close price from label
-        try:
-            sample_pre_close = float(self.label_pre_close_price.text())
-        except (ValueError, AttributeError):
-            sample_pre_close = 4.08  # Fallback value
-        
-        for i in range(10):
-            # Sell price
-            price_value = float(f"4.{11+i:02d}")
-            price_item = QtWidgets.QTableWidgetItem(f"4.{11+i:02d}")
-            price_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            
-            # Set color based on comparison with sample pre_close
-            if price_value < sample_pre_close:
-                price_item.setForeground(QtGui.QColor(0, 170, 0))  # Green
-            elif price_value > sample_pre_close:
-                price_item.setForeground(QtGui.QColor(255, 0, 0))  # Red
-            else:
-                price_item.setForeground(QtGui.QColor(255, 255, 255))  # White
-            
-            self.ask_table.setItem(i, 0, price_item)
-            
-            # Sell volume
-            volume_item = QtWidgets.QTableWidgetItem(f"{(10-i)*100}")
-            volume_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            self.ask_table.setItem(i, 1, volume_item)
+        # Populate with sample data and set colors based on pre_close price
+        price_values: list[float] = [(411 + i) / 100 for i in range(10)]
+        price_texts: list[str] = [self.price_format(value) for value in price_values]
+        price_brushes: list[QtGui.QBrush] = get_price_brushes(price_values, self.pre_close)
+
+        for i, (price_text, price_brush) in enumerate(zip(price_texts, price_brushes, strict=True)):
+            # Sell price and volume
+            self.ask_model.set_row(i, [price_text, f"{(10-i)*100}"], [price_brush, None])
         
-        # Resize columns to fit content and set proper widths
-        self.ask_table.resizeColumnsToContents()
+        # Attach model once filled so the view lays out all rows in one pass
+        self.ask_table.setModel(self.ask_model)
+
+        # Set fixed column widths, no need to measure contents
+        self.ask_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
         self.ask_table.setColumnWidth(0, 80)  # 卖价列宽度
         self.ask_table.setColumnWidth(1, 90)  # 卖量列宽度
-        
-        # Set row height for better visibility
-        for row in range(10):
-            self.ask_table.setRowHeight(row, 30)
     
     def init_info_table(self) -> None:
         """Initialize trading details table."""
-        self.info_table = QtWidgets.QTableWidget(self)
+        # Set up columns and rows for trading details (show recent 20 transactions)
+        self.info_model = DepthModel(["价格", "数量"], 20, self)
+
+        self.info_table = QtWidgets.QTableView(self)
         self.info_table.setGeometry(390, 60, 380, 400)  # 进一步调整位置和大小
         
-        # Hide row numbers
-        self.info_table.verticalHeader().setVisible(False)
+        # Hide row numbers, all rows share one fixed height for better visibility
+        vertical_header: QtWidgets.QHeaderView = self.info_table.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        vertical_header.setMinimumSectionSize(20)  # 默认最小高度随字体大于20
+        vertical_header.setDefaultSectionSize(20)
         
         # Set table properties for better row highlighting
         self.info_table.setAlternatingRowColors(False)  # Disable alternating colors
         self.info_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.info_table.setShowGrid(False)  # Hide grid lines for seamless background
         
-        # Set up columns for trading details
-        self.info_table.setColumnCount(2)
-        self.info_table.setHorizontalHeaderLabels(["价格", "数量"])
-        
-        # Set up rows for trading details (show recent 20 transactions)
-        self.info_table.setRowCount(20)
-        
         # Populate with sample trading details data
-        sample_trades = [
-            ("4.09", "1,200"),
-            ("4.08", "800"),
-            ("4.09", "1,500"),
-            ("4.08", "900"),
-            ("4.07", "1,100"),
-            ("4.08", "700"),
-            ("4.09", "1,300"),
-            ("4.08", "600"),
-            ("4.07", "1,000"),
-            ("4.08", "850"),
-            ("4.09", "1,400"),
-            ("4.08", "950"),
-            ("4.07", "750"),
-            ("4.08", "1,250"),
-            ("4.09", "680"),
-            ("4.08", "1,020"),
-            ("4.07", "890"),
-            ("4.08", "1,150"),
-            ("4.09", "720"),
-            ("4.08", "980")
-        ]
-        
-        for i, (price_str, volume_str) in enumerate(sample_trades):
-            # Parse volume to check if it's over 1000
-            volume_clean = volume_str.replace(',', '')  # Remove comma separators
-            try:
-                volume_value = int(volume_clean)
-            except ValueError:
-                volume_value = 0
-            
-            # Price with color coding
-            price_item = QtWidgets.QTableWidgetItem(price_str)
-            price_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            
-            # Volume
-            volume_item = QtWidgets.QTableWidgetItem(volume_str)
-            volume_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            
-            # Set items first
-            self.info_table.setItem(i, 0, price_item)
-            self.info_table.setItem(i, 1, volume_item)
-            
+        pre_close_value: float = self.pre_close
+
+        for i, (price_str, volume_str, price_value, volume_value) in enumerate(SAMPLE_TRADE_ROWS):
             # Set color and background based on comparison with pre_close price and volume
-            try:
-                price_value = float(price_str)
-                pre_close_value = float(self.label_pre_close_price.text())
-                
-                if volume_value >= 1000:  # Changed from > 1000 to >= 1000
-                    # High volume: use CSS style for entire row background
-                    if price_value > pre_close_value:
-                        # Red background for entire row when price above pre_close
-                        self.set_row_style(i, "background-color: rgb(200, 0, 0); color: white;")
-                    elif price_value < pre_close_value:
-                        # Green background for entire row when price below pre_close
-                        self.set_row_style(i, "background-color: rgb(0, 150, 0); color: white;")
-                    else:
-                        # Equal to pre_close, use white background with black text
-                        self.set_row_style(i, "background-color: white; color: black;")
+            background: QtGui.QBrush | None = None
+
+            if volume_value >= 1000:  # Changed from > 1000 to >= 1000
+                # High volume: use background color for entire row
+                if price_value > pre_close_value:
+                    # Red background for entire row when price above pre_close
+                    background = BRUSH_BG_UP
+                    price_brush = volume_brush = BRUSH_FLAT
+                elif price_value < pre_close_value:
+                    # Green background for entire row when price below pre_close
+                    background = BRUSH_BG_DOWN
+                    price_brush = volume_brush = BRUSH_FLAT
                 else:
-                    # Normal volume: only set text color without background
-                    if price_value < pre_close_value:
-                        price_item.setForeground(QtGui.QColor(0, 170, 0))  # Green text
-                        volume_item.setForeground(QtGui.QColor(255, 255, 255))  # White text for volume
-                    elif price_value > pre_close_value:
-                        price_item.setForeground(QtGui.QColor(255, 0, 0))  # Red text
-                        volume_item.setForeground(QtGui.QColor(255, 255, 255))  # White text for volume
-                    else:
-                        price_item.setForeground(QtGui.QColor(255, 255, 255))  # White text
-                        volume_item.setForeground(QtGui.QColor(255, 255, 255))  # White text for volume
-                    
-            except (ValueError, AttributeError):
-                # Default colors if parsing fails
-                price_item.setForeground(QtGui.QColor(255, 255, 255))  # Default white
-                volume_item.setForeground(QtGui.QColor(255, 255, 255))  # Default white
-        
-        # Resize columns to fit content and set proper widths
-        self.info_table.resizeColumnsToContents()
+                    # Equal to pre_close, use white background with black text
+                    background = BRUSH_FLAT
+                    price_brush = volume_brush = BRUSH_BLACK
+            else:
+                # Normal volume: only set text color without background
+                if price_value < pre_close_value:
+                    price_brush = BRUSH_DOWN  # Green text
+                elif price_value > pre_close_value:
+                    price_brush = BRUSH_UP  # Red text
+                else:
+                    price_brush = BRUSH_FLAT  # White text
+                volume_brush = BRUSH_FLAT  # White text for volume
+
+            self.info_model.set_row(i, [price_str, volume_str], [price_brush, volume_brush], [background, background])
+        
+        # Attach model once filled so the view lays out all rows in one pass
+        self.info_table.setModel(self.info_model)
+
+        # Set fixed column widths, no need to measure contents
+        self.info_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
         self.info_table.setColumnWidth(0, 120)  # 价格列宽度
         self.info_table.setColumnWidth(1, 180)  # 数量列宽度
-        
-        # Set row height for better visibility
-        for row in range(20):
-            self.info_table.setRowHeight(row, 20)
-    
-    def set_row_style(self, row: int, style: str) -> None:
-        """Set CSS style for entire row to achieve seamless row background color."""
-        for col in range(self.info_table.columnCount()):
-            item = self.info_table.item(row, col)
-            if item:
-                item.setData(QtCore.Qt.ItemDataRole.BackgroundRole, None)  # Clear default background
-                # Create a widget to hold the item with custom styling
-                widget = QtWidgets.QWidget()
-                widget.setStyleSheet(style)
-                layout = QtWidgets.QVBoxLayout(widget)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(0)
-                
-                # Create a label with the item text
-                label = QtWidgets.QLabel(item.text())
-                label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-                label.setStyleSheet(style)
-                layout.addWidget(label)
-                
-                # Set the widget as the cell widget
-                self.info_table.setCellWidget(row, col, widget)
     
     def register_event(self) -> None:
         """Register event handlers."""
         self.signal_tick.connect(self.process_tick_event)
-        self.event_engine.register(EVENT_TICK, self.signal_tick.emit)
+
+        # Tables are repainted at most once per interval with the latest tick
+        self.tick_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self.tick_timer.setSingleShot(True)
+        self.tick_timer.setInterval(40)
+        self.tick_timer.timeout.connect(self.flush_tick)
     
-    def process_tick_event(self, event: Event) -> None:
-        """Process tick data event."""
+    def queue_tick_event(self, event: Event) -> None:
+        """
+        Keep latest tick in event engine thread,
+        signal is only emitted if no earlier one is still queued.
+        """
         tick: TickData = event.data
         if not self.vt_symbol or tick.vt_symbol != self.vt_symbol:
             return
         
+        with self.tick_lock:
+            self.pending_tick = tick
+            if self.tick_queued:
+                return
+            self.tick_queued = True
+
+        self.signal_tick.emit(event)
+
+    def process_tick_event(self, event: Event) -> None:
+        """Process tick data event."""
+        # Cleared first so that ticks arriving from now on queue a new signal
+        with self.tick_lock:
+            self.tick_queued = False
+            pending: bool = self.pending_tick is not None
+
+        if pending and not self.tick_timer.isActive():
+            self.tick_timer.start()
+
+    def flush_tick(self) -> None:
+        """Update display with the latest pending tick."""
+        # Ticks received while hidden are folded into one update on show
+        if not self.tables_built or not self.isVisible():
+            return
+
+        # Take tick so that one stored meanwhile is kept for next flush
+        with self.tick_lock:
+            tick: TickData | None = self.pending_tick
+            self.pending_tick = None
+
+        # Drop tick kept by event engine thread before symbol changed
+        if not tick or tick.vt_symbol != self.vt_symbol:
+            return
+
+        self.update_tick(tick)
+
+    def update_tick(self, tick: TickData) -> None:
+        """Update price information and bid/ask levels."""
         # Update price information
         if tick.last_price:
             # Update current price in info table
-            current_price_item = self.info_table.item(0, 1)
-            if current_price_item:
-                current_price_item.setText(f"{tick.last_price:.2f}")
+            self.info_model.set_text(0, 1, self.price_format(tick.last_price))
         
-        # Update bid/ask levels
+        # Update bid/ask levels, only changed rows are repainted
         self.update_bid_ask_levels(tick)
         
         # Update daily statistics
+        values: dict[str, str] = {}
         if tick.high_price:
-            self.label_high_price.setText(f"{tick.high_price:.2f}")
+            values["high"] = self.price_format(tick.high_price)
         if tick.low_price:
-            self.label_low_price.setText(f"{tick.low_price:.2f}")
+            values["low"] = self.price_format(tick.low_price)
         if tick.open_price:
-            self.label_open_price.setText(f"{tick.open_price:.2f}")
+            values["open"] = self.price_format(tick.open_price)
         if tick.pre_close:
-            self.label_pre_close_price.setText(f"{tick.pre_close:.2f}")
+            self.pre_close = tick.pre_close
+            values["pre_close"] = self.price_format(tick.pre_close)
             
         # Calculate and update change percentage
         if tick.last_price and tick.pre_close:
             change_pct = (tick.last_price - tick.pre_close) / tick.pre_close * 100
-            self.label_change_pct.setText(f"{change_pct:+.2f}%")
+            values["change"] = self.change_format(change_pct)
             
             # Set color based on change
             if change_pct > 0:
-                self.label_change_pct.setStyleSheet("color: rgb(255, 0, 0);")
+                values["change_color"] = COLOR_UP.name()
             elif change_pct < 0:
-                self.label_change_pct.setStyleSheet("color: rgb(0, 170, 0);")
+                values["change_color"] = COLOR_DOWN.name()
             else:
-                self.label_change_pct.setStyleSheet("color: rgb(255, 255, 255);")
+                values["change_color"] = COLOR_FLAT.name()
+
+        self.set_header_values(values)
+
+    def set_header_values(self, values: dict[str, str]) -> None:
+        """Set values of header label, skipped if all same as last written."""
+        header_values: dict[str, str] = self.header_values
+        if all(header_values[key] == value for key, value in values.items()):
+            return
+
+        header_values.update(values)
+        self.header_label.setText(self.header_template.format_map(header_values))
     
     def update_bid_ask_levels(self, tick: TickData) -> None:
         """Update bid and ask level data with color coding based on pre_close price."""
         pre_close = tick.pre_close if tick.pre_close else 0
         
-        # Update bid levels
-        bid_prices = [tick.bid_price_1, tick.bid_price_2, tick.bid_price_3, tick.bid_price_4, tick.bid_price_5]
-        bid_volumes = [tick.bid_volume_1, tick.bid_volume_2, tick.bid_volume_3, tick.bid_volume_4, tick.bid_volume_5]
-        
-        for i, (price, volume) in enumerate(zip(bid_prices, bid_volumes)):
-            if price and volume:
-                price_item = self.bid_table.item(4-i, 0)  # Reverse order for bid (highest first)
-                volume_item = self.bid_table.item(4-i, 1)
-                if price_item and volume_item:
-                    price_item.setText(f"{price:.2f}")
-                    volume_item.setText(f"{int(volume):,}")
-                    
-                    # Set color based on comparison with pre_close price
-                    if pre_close > 0:
-                        if price < pre_close:
-                            # Green for prices below pre_close
-                            price_item.setForeground(QtGui.QColor(0, 170, 0))
-                        elif price > pre_close:
-                            # Red for prices above pre_close
-                            price_item.setForeground(QtGui.QColor(255, 0, 0))
-                        else:
-                            # White for prices equal to pre_close
-                            price_item.setForeground(QtGui.QColor(255, 255, 255))
+        bid_prices: tuple = self.bid_price_getter(tick)
+        bid_volumes: tuple = self.bid_volume_getter(tick)
+        ask_prices: tuple = self.ask_price_getter(tick)
+        ask_volumes: tuple = self.ask_volume_getter(tick)
+
+        # Pick colors of all levels in one pass based on pre_close price
+        if pre_close > 0:
+            brushes: Sequence[QtGui.QBrush | None] = get_price_brushes(bid_prices + ask_prices, pre_close)
+        else:
+            brushes = [None] * 10
+        
+        # Update bid levels, unchanged levels are not formatted again
+        bid_levels: list[tuple] = self.bid_levels
+        for i, level in enumerate(zip(bid_prices, bid_volumes, brushes[:5], strict=True)):
+            price, volume, brush = level
+            if price and volume and level != bid_levels[i]:
+                bid_levels[i] = level
+                texts: list[str] = [self.price_format(price), format_volume_grouped(volume)]
+
+                # Reverse order for bid (highest first)
+                if brush is not None:
+                    self.bid_model.set_row(4-i, texts, [brush, None])
+                else:
+                    self.bid_model.set_row(4-i, texts)
         
         # Update ask levels
-        ask_prices = [tick.ask_price_1, tick.ask_price_2, tick.ask_price_3, tick.ask_price_4, tick.ask_price_5]
-        ask_volumes = [tick.ask_volume_1, tick.ask_volume_2, tick.ask_volume_3, tick.ask_volume_4, tick.ask_volume_5]
-        
-        for i, (price, volume) in enumerate(zip(ask_prices, ask_volumes)):
-            if price and volume:
-                price_item = self.ask_table.item(i, 0)
-                volume_item = self.ask_table.item(i, 1)
-                if price_item and volume_item:
-                    price_item.setText(f"{price:.2f}")
-                    volume_item.setText(f"{int(volume):,}")
-                    
-                    # Set color based on comparison with pre_close price
-                    if pre_close > 0:
-                        if price < pre_close:
-                            # Green for prices below pre_close
-                            price_item.setForeground(QtGui.QColor(0, 170, 0))
-                        elif price > pre_close:
-                            # Red for prices above pre_close
-                            price_item.setForeground(QtGui.QColor(255, 0, 0))
-                        else:
-                            # White for prices equal to pre_close
-                            price_item.setForeground(QtGui.QColor(255, 255, 255))
+        ask_levels: list[tuple] = self.ask_levels
+        for i, level in enumerate(zip(ask_prices, ask_volumes, brushes[5:], strict=True)):
+            price, volume, brush = level
+            if price and volume and level != ask_levels[i]:
+                ask_levels[i] = level
+                texts = [self.price_format(price), format_volume_grouped(volume)]
+
+                if brush is not None:
+                    self.ask_model.set_row(i, texts, [brush, None])
+                else:
+                    self.ask_model.set_row(i, texts)
     
     def set_symbol(self, vt_symbol: str, symbol_name: str = "") -> None:
         """Set the symbol to monitor."""
-        self.vt_symbol = vt_symbol
+        # Listen to tick events of this symbol only
+        if vt_symbol != self.vt_symbol:
+            if self.vt_symbol:
+                self.event_engine.unregister(EVENT_TICK + self.vt_symbol, self.queue_tick_event)
+            self.event_engine.register(EVENT_TICK + vt_symbol, self.queue_tick_event)
+
+        self.vt_symbol = intern(vt_symbol)
         self.symbol_name = symbol_name
+
+        with self.tick_lock:
+            self.pending_tick = None
         
         # Update window title
         if symbol_name:
@@ -2105,20 +2868,24 @@ class Level2Widget(QtWidgets.QFrame):
         if gateway_names:
             self.main_engine.subscribe(req, gateway_names[0])
     
-    def closeEvent(self, event) -> None:
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """Handle window close event."""
-        # Find and remove this widget from main window's widgets dict
-        if hasattr(self, '_widget_name'):
-            # Get the main window instance
-            parent = self.parent()
-            while parent:
-                if hasattr(parent, 'widgets') and hasattr(parent, 'main_engine'):
-                    # Found the main window
-                    if self._widget_name in parent.widgets:
-                        del parent.widgets[self._widget_name]
-                    break
-                parent = parent.parent()
+        # Remove this widget from main window's widgets dict
+        if self._main_window_ref:
+            main_window: Any = self._main_window_ref()
+            if main_window is not None:
+                main_window.widgets.pop(self._widget_name, None)
         
+        # Stop receiving and painting ticks
+        if self.vt_symbol:
+            self.event_engine.unregister(EVENT_TICK + self.vt_symbol, self.queue_tick_event)
+            self.vt_symbol = ""
+
+        self.tick_timer.stop()
+
+        with self.tick_lock:
+            self.pending_tick = None
+
         # Call parent closeEvent
         super().closeEvent(event)
 